@@ -221,63 +221,77 @@ class AIService:
         from services.audio_splitter import AudioSplitter
         
         splitter = AudioSplitter()
-        chunk_files = splitter.split_audio_file(audio_file_path if compressed_file is None else compressed_file)
-        
-        logger.info(f"Split into {len(chunk_files)} chunks")
+        # Chunks are yielded as ffmpeg finishes them, so splitting of the next
+        # chunk overlaps with transcription of the current one
+        chunk_stream = splitter.split_audio_file_streaming(
+            audio_file_path if compressed_file is None else compressed_file
+        )
         
         # Transcribe each chunk with better error handling
         transcripts = []
         successful_chunks = 0
         failed_chunks = 0
+        chunk_files = []
         temp_chunk_files = []  # Track temp files for cleanup
         
-        for i, chunk_file in enumerate(chunk_files, 1):
-            logger.info(f"Transcribing chunk {i}/{len(chunk_files)}...")
-            
-            # Validate chunk file before transcribing
-            if not os.path.exists(chunk_file):
-                logger.warning(f"Chunk {i} file does not exist, skipping...")
-                failed_chunks += 1
-                continue
-            
-            chunk_size = os.path.getsize(chunk_file)
-            if chunk_size == 0:
-                logger.warning(f"Chunk {i} is empty, skipping...")
-                failed_chunks += 1
-                continue
-            
-            if chunk_size > self.max_chunk_size * 1.1:  # Allow 10% tolerance
-                logger.warning(f"Chunk {i} is too large ({chunk_size / (1024*1024):.2f}MB), skipping...")
-                failed_chunks += 1
-                continue
-            
-            # Track temp files for cleanup
-            if chunk_file != audio_file_path and '_chunk_' in chunk_file:
-                temp_chunk_files.append(chunk_file)
-            
-            try:
-                chunk_transcript = self._transcribe_single_file(chunk_file, language)
-                if chunk_transcript and chunk_transcript.strip():
-                    transcripts.append(chunk_transcript)
-                    successful_chunks += 1
-                    logger.info(f"Successfully transcribed chunk {i}")
-                else:
-                    logger.warning(f"Chunk {i} returned empty transcript")
+        try:
+            for i, chunk_file in enumerate(chunk_stream, 1):
+                chunk_files.append(chunk_file)
+                logger.info(f"Transcribing chunk {i}...")
+                
+                # Validate chunk file before transcribing
+                if not os.path.exists(chunk_file):
+                    logger.warning(f"Chunk {i} file does not exist, skipping...")
                     failed_chunks += 1
-            except Exception as e:
-                error_msg = str(e)
-                # Check for specific error types
-                if '404' in error_msg or 'Not Found' in error_msg:
-                    logger.warning(f"Chunk {i} may be invalid or corrupt (404 error). This can happen if FFmpeg is not available. Skipping...")
-                elif 'format' in error_msg.lower():
-                    logger.warning(f"Chunk {i} format issue: {error_msg}")
-                else:
-                    logger.warning(f"Failed to transcribe chunk {i}: {error_msg}")
-                failed_chunks += 1
+                    continue
+                
+                chunk_size = os.path.getsize(chunk_file)
+                if chunk_size == 0:
+                    logger.warning(f"Chunk {i} is empty, skipping...")
+                    failed_chunks += 1
+                    continue
+                
+                if chunk_size > self.max_chunk_size * 1.1:  # Allow 10% tolerance
+                    logger.warning(f"Chunk {i} is too large ({chunk_size / (1024*1024):.2f}MB), skipping...")
+                    failed_chunks += 1
+                    continue
+                
+                # Track temp files for cleanup
+                if chunk_file != audio_file_path and '_chunk_' in chunk_file:
+                    temp_chunk_files.append(chunk_file)
+                
+                try:
+                    chunk_transcript = self._transcribe_single_file(chunk_file, language)
+                    if chunk_transcript and chunk_transcript.strip():
+                        transcripts.append(chunk_transcript)
+                        successful_chunks += 1
+                        logger.info(f"Successfully transcribed chunk {i}")
+                    else:
+                        logger.warning(f"Chunk {i} returned empty transcript")
+                        failed_chunks += 1
+                    # Chunk has been read, drop it from the page cache until cleanup
+                    splitter.release_page_cache(chunk_file)
+                except Exception as e:
+                    error_msg = str(e)
+                    # Check for specific error types
+                    if '404' in error_msg or 'Not Found' in error_msg:
+                        logger.warning(f"Chunk {i} may be invalid or corrupt (404 error). This can happen if FFmpeg is not available. Skipping...")
+                    elif 'format' in error_msg.lower():
+                        logger.warning(f"Chunk {i} format issue: {error_msg}")
+                    else:
+                        logger.warning(f"Failed to transcribe chunk {i}: {error_msg}")
+                    failed_chunks += 1
+        finally:
+            # Runs even when splitting fails part-way (ffmpeg errors surface
+            # from chunk_stream inside the loop): stop the splitter and remove
+            # every temp file created so far
+            chunk_stream.close()
+            if temp_chunk_files:
+                splitter.cleanup_chunks(temp_chunk_files)
+            if compressed_file:
+                self._cleanup_compressed_file(compressed_file)
         
-        # Clean up temp chunk files
-        if temp_chunk_files:
-            splitter.cleanup_chunks(temp_chunk_files)
+        logger.info(f"Split into {len(chunk_files)} chunks")
         
         # Check if we got any successful transcriptions
         if not transcripts:
@@ -306,17 +320,22 @@ class AIService:
         if failed_chunks > 0:
             logger.warning(f"{failed_chunks} chunks failed, but continuing with {successful_chunks} successful transcriptions")
         
-        # Clean up compressed file if used
-        if compressed_file and compressed_file != audio_file_path:
-            try:
-                from services.audio_compressor import AudioCompressor
-                compressor = AudioCompressor()
-                compressor.cleanup_temp_file(compressed_file)
-            except Exception as e:
-                logger.warning(f"Failed to cleanup compressed file: {e}")
-        
         return combined_transcript
     
+    def _cleanup_compressed_file(self, compressed_file: str) -> None:
+        """
+        Remove the temporary compressed copy of an audio file.
+        
+        Args:
+            compressed_file: Path returned by AudioCompressor.compress_audio
+        """
+        try:
+            from services.audio_compressor import AudioCompressor
+            compressor = AudioCompressor()
+            compressor.cleanup_temp_file(compressed_file)
+        except Exception as e:
+            logger.warning(f"Failed to cleanup compressed file: {e}")
+    
     def _transcribe_single_file(
         self,
         audio_file_path: str,
@@ -393,8 +412,8 @@ class AIService:
                             # Normalize text to fix capitalization issues
                             transcript = transcript_response.text
                             try:
-                                from utils.text_normalizer import TextNormalizer
-                                normalizer = TextNormalizer()
+                                from utils.text_normalizer import get_text_normalizer
+                                normalizer = get_text_normalizer()
                                 transcript = normalizer.normalize(transcript, language=language)
                                 logger.debug("[API] Applied text normalization")
                             except Exception as e:
@@ -666,8 +685,8 @@ class AIService:
             # Normalize text for all languages (fix capitalization issues)
             logger.info("[LOCAL WHISPER] Normalizing text (fixing capitalization)...")
             try:
-                from utils.text_normalizer import TextNormalizer
-                normalizer = TextNormalizer()
+                from utils.text_normalizer import get_text_normalizer
+                normalizer = get_text_normalizer()
                 transcript = normalizer.normalize(transcript, language=language)
                 logger.info("[LOCAL WHISPER] Applied text normalization")
             except Exception as e:
@@ -678,8 +697,8 @@ class AIService:
             if language == 'vi':
                 logger.info("[LOCAL WHISPER] Applying Vietnamese post-processing...")
                 try:
-                    from utils.vietnamese_postprocessor import VietnamesePostProcessor
-                    post_processor = VietnamesePostProcessor()
+                    from utils.vietnamese_postprocessor import get_vietnamese_postprocessor
+                    post_processor = get_vietnamese_postprocessor()
                     transcript = post_processor.post_process(transcript)
                     logger.info("[LOCAL WHISPER] Applied Vietnamese post-processing")
                 except Exception as e:
@@ -808,10 +827,9 @@ class AIService:
             Summary text
         """
         logger.info("[SUMMARIZATION] Building prompts...")
-        from utils.prompt_builder import PromptBuilder
+        from utils.prompt_builder import build_summary_prompt
         
-        prompt_builder = PromptBuilder()
-        system_message, user_prompt = prompt_builder.build_summary_prompt(
+        system_message, user_prompt = build_summary_prompt(
             transcript=transcript,
             topic=topic,
             language=language,
@@ -862,28 +880,30 @@ class AIService:
             Final summary text
         """
         from utils.text_chunker import TextChunker
-        from utils.prompt_builder import PromptBuilder
+        from utils.prompt_builder import get_language_name
         
         # Split transcript into chunks
         logger.info("[SUMMARIZATION] Splitting transcript into chunks...")
         chunker = TextChunker()
-        chunks = chunker.chunk_text(transcript)
-        logger.info(f"[SUMMARIZATION] Split transcript into {len(chunks)} chunks")
+        # Only chunk boundaries are kept up front; each chunk is sliced out
+        # of the transcript when its turn comes
+        chunk_spans = chunker.chunk_text_spans(transcript)
+        logger.info(f"[SUMMARIZATION] Split transcript into {len(chunk_spans)} chunks")
         
         # Summarize each chunk
         chunk_summaries: List[str] = []
         import time
-        for i, chunk in enumerate(chunks, 1):
-            logger.info(f"[SUMMARIZATION] Processing chunk {i}/{len(chunks)}...")
+        for i, (span_start, span_end) in enumerate(chunk_spans, 1):
+            logger.info(f"[SUMMARIZATION] Processing chunk {i}/{len(chunk_spans)}...")
             chunk_start = time.time()
             chunk_summary = self._summarize_single_chunk(
-                transcript=chunk,
+                transcript=transcript[span_start:span_end],
                 topic=topic,  # Include topic for context
                 language=language,
                 custom_language=custom_language
             )
             chunk_duration = time.time() - chunk_start
-            logger.info(f"[SUMMARIZATION] Chunk {i}/{len(chunks)} completed in {chunk_duration:.2f} seconds")
+            logger.info(f"[SUMMARIZATION] Chunk {i}/{len(chunk_spans)} completed in {chunk_duration:.2f} seconds")
             chunk_summaries.append(chunk_summary)
         
         # If we only have one chunk summary, return it
@@ -900,13 +920,7 @@ class AIService:
         
         # Create prompt for final summary
         logger.info("[SUMMARIZATION] Building final summary prompt...")
-        prompt_builder = PromptBuilder()
-        # Get language name (using the same logic as PromptBuilder)
-        if language == 'other' and custom_language:
-            language_name = custom_language
-        else:
-            from config import LANGUAGE_NAMES
-            language_name = LANGUAGE_NAMES.get(language, 'the language used')
+        language_name = get_language_name(language, custom_language)
         
         system_message = (
             f"You are a professional meeting assistant. Combine multiple section summaries "
@@ -3,16 +3,28 @@ Audio Splitter Module
 Handles splitting large audio files into smaller chunks for processing.
 """
 import os
+import queue
 import subprocess
 import tempfile
+import threading
 import logging
-from typing import List, Tuple
+from typing import Iterator, List, Optional, Tuple
 from pathlib import Path
 
 from utils.ffmpeg_checker import get_ffmpeg_checker
 
+# PyAV is optional: when installed, container headers are read in-process
+# instead of spawning ffprobe for every file
+try:
+    import av
+except ImportError:
+    av = None
+
 logger = logging.getLogger(__name__)
 
+# Marks the end of the chunk stream produced by split_audio_file_streaming
+_SPLIT_DONE = object()
+
 
 class AudioSplitter:
     """Service for splitting large audio files into smaller chunks."""
@@ -20,6 +32,8 @@ class AudioSplitter:
     # Whisper API limit is 25MB per file
     MAX_CHUNK_SIZE = 25 * 1024 * 1024  # 25MB
     CHUNK_DURATION_ESTIMATE = 600  # Estimate 10 minutes per 25MB (rough estimate)
+    # Source formats where ffmpeg stream copy can be tried before re-encoding
+    COPY_CODEC_EXTENSIONS = {'.mp3', '.mp4', '.m4a'}
     
     def __init__(self, max_chunk_size: int = None):
         """
@@ -52,11 +66,7 @@ class AudioSplitter:
         if file_size <= self.max_chunk_size:
             return [audio_file_path]
         
-        # Create output directory
-        if output_dir is None:
-            output_dir = tempfile.mkdtemp(prefix='audio_chunks_')
-        else:
-            Path(output_dir).mkdir(parents=True, exist_ok=True)
+        output_dir = self._prepare_output_dir(output_dir)
         
         try:
             if self._ffmpeg_available:
@@ -64,14 +74,120 @@ class AudioSplitter:
             else:
                 # FFmpeg is required for proper audio splitting
                 # Binary splitting creates invalid audio files
-                raise RuntimeError(
-                    "FFmpeg is required to split large audio files.\n\n"
-                    + self._ffmpeg_checker.get_installation_instructions() +
-                    "\n\nAlternatively, compress or split your audio file manually before uploading."
-                )
+                raise RuntimeError(self._ffmpeg_required_message())
         except Exception as e:
             raise RuntimeError(f"Failed to split audio file: {str(e)}")
     
+    def split_audio_file_streaming(self, audio_file_path: str, output_dir: str = None) -> Iterator[str]:
+        """
+        Split large audio file into chunks, yielding each chunk as soon as it is written.
+        
+        FFmpeg runs in a background thread, so the caller can process one chunk
+        while the next ones are still being encoded. Chunks that were already
+        yielded stay on disk until the caller removes them with cleanup_chunks;
+        chunks that were never yielded are removed when the generator is closed.
+        
+        Args:
+            audio_file_path: Path to the audio file
+            output_dir: Directory to save chunks (optional, uses temp dir if not provided)
+            
+        Yields:
+            Paths to chunk files, in playback order
+            
+        Raises:
+            RuntimeError: If splitting fails
+        """
+        # If file is small enough, yield original file path
+        if os.path.getsize(audio_file_path) <= self.max_chunk_size:
+            yield audio_file_path
+            return
+        
+        if not self._ffmpeg_available:
+            raise RuntimeError(f"Failed to split audio file: {self._ffmpeg_required_message()}")
+        
+        output_dir = self._prepare_output_dir(output_dir)
+        chunk_queue: queue.Queue = queue.Queue()
+        stop_event = threading.Event()
+        # Held while handing a chunk over and while stopping, so every chunk
+        # is either queued before the stop (and removed with the queue) or
+        # removed by the producer itself
+        handoff_lock = threading.Lock()
+        
+        def produce_chunks():
+            chunks = self._iter_ffmpeg_chunks(audio_file_path, output_dir)
+            try:
+                for chunk_file in chunks:
+                    with handoff_lock:
+                        if stop_event.is_set():
+                            # Finished after the caller stopped; it will never
+                            # be yielded, so nobody else can clean it up
+                            self.cleanup_chunks([chunk_file])
+                            break
+                        chunk_queue.put(chunk_file)
+                    # Don't start another ffmpeg run once the caller stopped
+                    if stop_event.is_set():
+                        break
+            except Exception as e:
+                chunk_queue.put(e)
+            finally:
+                chunks.close()
+                chunk_queue.put(_SPLIT_DONE)
+        
+        producer = threading.Thread(
+            target=produce_chunks,
+            daemon=True,
+            name=f"AudioSplitter-{Path(audio_file_path).stem}"
+        )
+        producer.start()
+        
+        try:
+            while True:
+                item = chunk_queue.get()
+                if item is _SPLIT_DONE:
+                    break
+                if isinstance(item, Exception):
+                    raise RuntimeError(f"Failed to split audio file: {str(item)}")
+                yield item
+        finally:
+            # Stop encoding further chunks if the caller stops iterating early,
+            # and remove chunks that were queued but never yielded (the caller
+            # only knows about yielded paths)
+            with handoff_lock:
+                stop_event.set()
+                leftover = []
+                while True:
+                    try:
+                        item = chunk_queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if isinstance(item, str):
+                        leftover.append(item)
+            if leftover:
+                self.cleanup_chunks(leftover)
+    
+    def _prepare_output_dir(self, output_dir: Optional[str]) -> str:
+        """
+        Create the chunk output directory.
+        
+        Args:
+            output_dir: Requested directory, or None to create a temp dir
+            
+        Returns:
+            Path to the output directory
+        """
+        if output_dir is None:
+            return tempfile.mkdtemp(prefix='audio_chunks_')
+        Path(output_dir).mkdir(parents=True, exist_ok=True)
+        return output_dir
+    
+    def _ffmpeg_required_message(self) -> str:
+        """Get the error message shown when FFmpeg is needed for splitting."""
+        return (
+            "FFmpeg is required to split large audio files.\n\n"
+            + self._ffmpeg_checker.get_installation_instructions() +
+            "\n\nAlternatively, compress or split your audio file manually before uploading."
+        )
+    
     def _split_with_ffmpeg(self, audio_file_path: str, output_dir: str) -> List[str]:
         """
         Split audio file using ffmpeg (best quality).
@@ -83,26 +199,26 @@ class AudioSplitter:
         Returns:
             List of chunk file paths
         """
+        return list(self._iter_ffmpeg_chunks(audio_file_path, output_dir))
+    
+    def _iter_ffmpeg_chunks(self, audio_file_path: str, output_dir: str) -> Iterator[str]:
+        """
+        Produce chunks with ffmpeg one at a time.
+        
+        Args:
+            audio_file_path: Path to the audio file
+            output_dir: Directory to save chunks
+            
+        Yields:
+            Chunk file paths as each one is written
+        """
         base_name = Path(audio_file_path).stem
         # Always use .mp3 for chunks to ensure compatibility with Whisper API
         extension = '.mp3'
         
-        # Get audio duration using ffprobe
-        try:
-            probe_cmd = [
-                'ffprobe', '-v', 'error', '-show_entries',
-                'format=duration', '-of', 'default=noprint_wrappers=1:nokey=1',
-                audio_file_path
-            ]
-            result = subprocess.run(
-                probe_cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                timeout=30
-            )
-            duration = float(result.stdout.strip())
-        except (ValueError, subprocess.TimeoutExpired, FileNotFoundError):
+        # Get audio duration (and bitrate, if reported) using ffprobe
+        duration, bit_rate = self._probe_audio(audio_file_path)
+        if duration is None:
             # If we can't get duration, estimate from file size
             file_size = os.path.getsize(audio_file_path)
             # Rough estimate: 1MB ≈ 1 minute (depends on bitrate)
@@ -113,19 +229,30 @@ class AudioSplitter:
         chunks_needed = (file_size // self.max_chunk_size) + 1
         chunk_duration = duration / chunks_needed
         
-        chunk_files = []
-        start_time = 0
-        chunk_index = 0
+        # Decide once whether stream copy is worth trying for this file.
+        # If the source bitrate predicts chunks larger than the limit, copy
+        # would only produce oversized chunks and we go straight to re-encode.
+        original_ext = Path(audio_file_path).suffix.lower()
+        try_copy = original_ext in self.COPY_CODEC_EXTENSIONS
+        if try_copy and bit_rate:
+            predicted_copy_size = (bit_rate / 8) * chunk_duration
+            try_copy = predicted_copy_size <= self.max_chunk_size
         
-        while start_time < duration:
-            chunk_file = os.path.join(
-                output_dir,
-                f"{base_name}_chunk_{chunk_index:03d}{extension}"
+        # Precompute chunk boundaries from the index rather than accumulating
+        # start times, so there is no floating-point drift across chunks and
+        # the number of chunks is bounded by chunks_needed
+        chunk_tasks = [
+            (
+                chunk_index * chunk_duration,
+                min((chunk_index + 1) * chunk_duration, duration),
+                os.path.join(output_dir, f"{base_name}_chunk_{chunk_index:03d}{extension}")
             )
-            
-            # Calculate end time (ensure we don't exceed duration)
-            end_time = min(start_time + chunk_duration, duration)
-            
+            for chunk_index in range(chunks_needed if duration > 0 else 0)
+        ]
+        
+        produced_chunk = False
+        
+        for start_time, end_time, chunk_file in chunk_tasks:
             # Use ffmpeg to extract chunk
             # Re-encode to ensure valid output format that Whisper can handle
             cmd = [
@@ -141,8 +268,7 @@ class AudioSplitter:
             ]
             
             # If original file is already MP3 or MP4, try to use copy first
-            original_ext = Path(audio_file_path).suffix.lower()
-            if original_ext in ['.mp3', '.mp4', '.m4a']:
+            if try_copy:
                 # Try copy codec first (faster and preserves quality)
                 cmd_copy = [
                     'ffmpeg', '-i', audio_file_path,
@@ -164,15 +290,14 @@ class AudioSplitter:
                     if os.path.exists(chunk_file):
                         chunk_size = os.path.getsize(chunk_file)
                         if chunk_size > 0 and chunk_size <= self.max_chunk_size * 1.1:
-                            chunk_files.append(chunk_file)
-                            start_time = end_time
-                            chunk_index += 1
-                            if chunk_index > 100:
-                                break
+                            produced_chunk = True
+                            yield chunk_file
                             continue
+                    # Copy produced an unusable chunk, don't retry it for this file
+                    try_copy = False
                 except subprocess.CalledProcessError:
-                    # If copy failed, fall back to re-encoding
-                    pass
+                    # If copy failed, fall back to re-encoding for the rest of the file
+                    try_copy = False
             
             try:
                 result = subprocess.run(
@@ -190,21 +315,94 @@ class AudioSplitter:
                         # If chunk is still too large, recursively split it
                         if chunk_size > self.max_chunk_size:
                             sub_chunks = self._split_with_ffmpeg(chunk_file, output_dir)
-                            chunk_files.extend(sub_chunks)
-                            os.remove(chunk_file)  # Remove temporary chunk
+                            if chunk_file not in sub_chunks:
+                                os.remove(chunk_file)  # Remove temporary chunk
+                            produced_chunk = True
+                            yield from sub_chunks
                         else:
-                            chunk_files.append(chunk_file)
+                            produced_chunk = True
+                            yield chunk_file
             except subprocess.CalledProcessError as e:
                 raise RuntimeError(f"FFmpeg error: {e.stderr.decode() if e.stderr else str(e)}")
+        
+        if not produced_chunk:
+            yield audio_file_path
+    
+    def release_page_cache(self, chunk_file: str):
+        """
+        Advise the kernel to drop cached pages of a chunk that has been read.
+        
+        Chunks are read once (uploaded or transcribed) and then deleted, so
+        keeping them in the page cache until cleanup only wastes memory.
+        No-op on platforms without posix_fadvise.
+        
+        Args:
+            chunk_file: Path to the chunk file that has been consumed
+        """
+        if not hasattr(os, 'posix_fadvise'):
+            return
+        try:
+            fd = os.open(chunk_file, os.O_RDONLY)
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+            finally:
+                os.close(fd)
+        except OSError as e:
+            logger.debug(f"Could not release page cache for {chunk_file}: {e}")
+    
+    def _probe_audio(self, audio_file_path: str) -> Tuple[Optional[float], Optional[int]]:
+        """
+        Read duration and bitrate of an audio file.
+        Uses PyAV when available, otherwise falls back to ffprobe.
+        
+        Args:
+            audio_file_path: Path to the audio file
             
-            start_time = end_time
-            chunk_index += 1
-            
-            # Safety check to avoid infinite loop
-            if chunk_index > 100:
-                break
+        Returns:
+            Tuple of (duration_seconds, bit_rate_bps); either is None if unknown
+        """
+        if av is not None:
+            try:
+                with av.open(audio_file_path) as container:
+                    duration = (
+                        container.duration / av.time_base
+                        if container.duration is not None else None
+                    )
+                    bit_rate = container.bit_rate or None
+                if duration is not None:
+                    return duration, bit_rate
+            except Exception as e:
+                logger.debug(f"PyAV probe failed for {audio_file_path}, using ffprobe: {e}")
+        
+        probe_cmd = [
+            'ffprobe', '-v', 'error', '-show_entries',
+            'format=duration,bit_rate', '-of', 'default=noprint_wrappers=1',
+            audio_file_path
+        ]
+        try:
+            result = subprocess.run(
+                probe_cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                timeout=30
+            )
+        except (subprocess.TimeoutExpired, FileNotFoundError):
+            return None, None
+        
+        fields = dict(
+            line.split('=', 1) for line in result.stdout.splitlines() if '=' in line
+        )
+        try:
+            duration = float(fields.get('duration', ''))
+        except ValueError:
+            duration = None
+        try:
+            bit_rate = int(fields.get('bit_rate', ''))
+        except ValueError:
+            bit_rate = None
         
-        return chunk_files if chunk_files else [audio_file_path]
+        return duration, bit_rate
     
     def cleanup_chunks(self, chunk_files: List[str]):
         """
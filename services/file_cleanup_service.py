@@ -229,17 +229,20 @@ class FileCleanupService:
         cutoff_time = time.time() - (self.retention_days * 24 * 60 * 60)
         
         try:
-            for file_path in self.upload_folder.iterdir():
-                if file_path.is_file():
-                    file_size = file_path.stat().st_size
-                    file_mtime = file_path.stat().st_mtime
+            # os.scandir caches each entry's stat result, so every file costs
+            # a single stat call instead of one per attribute read
+            with os.scandir(self.upload_folder) as entries:
+                for entry in entries:
+                    if not entry.is_file():
+                        continue
                     
+                    file_stat = entry.stat()
                     total_files += 1
-                    total_size += file_size
+                    total_size += file_stat.st_size
                     
-                    if file_mtime < cutoff_time:
+                    if file_stat.st_mtime < cutoff_time:
                         old_files_count += 1
-                        old_files_size += file_size
+                        old_files_size += file_stat.st_size
         except Exception as e:
             logger.error(f"Error getting storage stats: {e}")
         
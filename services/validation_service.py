@@ -19,8 +19,14 @@ class ValidationService:
     - Check required fields
     """
     
-    @staticmethod
-    def validate_audio_request(form_data: Dict, files: Dict) -> Tuple[bool, Optional[str], Dict]:
+    # Required form fields and the error message returned when missing
+    _REQUIRED_FIELDS = (
+        ('topic', 'Meeting Topic is required'),
+        ('language', 'Conversation Language is required'),
+    )
+    
+    @classmethod
+    def validate_audio_request(cls, form_data: Dict, files: Dict) -> Tuple[bool, Optional[str], Dict]:
         """
         Validate audio processing request.
         
@@ -33,33 +39,30 @@ class ValidationService:
             validated_data contains: topic, language, custom_language
         """
         # Check audio file
-        if 'audio_data' not in files:
+        file = files.get('audio_data')
+        if file is None:
             return False, "No audio file found in request", {}
         
-        file = files['audio_data']
-        if not file or file.filename == '':
+        if not file or not getattr(file, 'filename', ''):
             return False, "No file selected", {}
         
-        # Validate topic
-        topic = form_data.get('topic', '').strip()
-        if not topic:
-            return False, "Meeting Topic is required", {}
+        # Validate required fields (topic, language)
+        validated_data = {}
+        for key, error_message in cls._REQUIRED_FIELDS:
+            value = form_data.get(key, '').strip()
+            if not value:
+                return False, error_message, {}
+            validated_data[key] = value
         
-        # Validate language
-        language = form_data.get('language', '').strip()
-        if not language:
-            return False, "Conversation Language is required", {}
+        topic = validated_data['topic']
+        language = validated_data['language']
         
         # Validate custom language if "other" is selected
         custom_language = form_data.get('custom_language', '').strip() or None
         if language == 'other' and not custom_language:
             return False, "Custom language is required when 'Other' is selected", {}
         
-        validated_data = {
-            'topic': topic,
-            'language': language,
-            'custom_language': custom_language
-        }
+        validated_data['custom_language'] = custom_language
         
         logger.info(f"Validation passed - Topic: {topic}, Language: {language}")
         if custom_language:
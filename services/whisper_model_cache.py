@@ -3,12 +3,50 @@ Whisper Model Cache Module
 Caches Whisper models to avoid reloading on every request.
 Preloads models when server starts for better user experience.
 """
+import asyncio
 import threading
+import time
+import warnings
 from typing import Optional, Dict
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Whisper (and with it torch) is imported lazily on first model load, so
+# importing this module stays cheap on the startup path
+_whisper_module = None
+_whisper_import_error: Optional[ImportError] = None
+_whisper_import_lock = threading.Lock()
+
+
+def _import_whisper():
+    """
+    Import the whisper package once and return it.
+    
+    Guarded by its own lock so the slow first import happens outside the
+    per-model loading locks. A failed import is remembered and re-raised
+    instead of being attempted again on every load.
+    
+    Returns:
+        The whisper module
+        
+    Raises:
+        ImportError: If openai-whisper is not installed or fails to import
+    """
+    global _whisper_module, _whisper_import_error
+    if _whisper_module is None:
+        with _whisper_import_lock:
+            if _whisper_module is None:
+                if _whisper_import_error is not None:
+                    raise ImportError(str(_whisper_import_error)) from _whisper_import_error
+                try:
+                    import whisper
+                except ImportError as e:
+                    _whisper_import_error = e
+                    raise
+                _whisper_module = whisper
+    return _whisper_module
+
 
 class WhisperModelCache:
     """
@@ -35,6 +73,8 @@ class WhisperModelCache:
         
         self.models: Dict[str, any] = {}  # Store loaded models
         self.loading: Dict[str, threading.Lock] = {}  # Locks for loading models
+        self._async_loading: Dict[str, asyncio.Lock] = {}  # Locks for aget_model
+        self._async_loading_guard = threading.Lock()
         self._initialized = True
         logger.info("[WHISPER CACHE] Model cache initialized")
     
@@ -54,11 +94,19 @@ class WhisperModelCache:
             logger.info(f"[WHISPER CACHE] Model '{model_name}' found in cache")
             return self.models[model_name]
         
+        # Import whisper before taking the per-model lock, so loading one
+        # model never waits on the import behind another model's lock
+        try:
+            whisper_module = _import_whisper()
+        except ImportError as e:
+            logger.error(f"[WHISPER CACHE] ✗ Failed to load model '{model_name}': {e}")
+            raise
+        
         # Check if model is currently being loaded
-        if model_name not in self.loading:
-            self.loading[model_name] = threading.Lock()
+        # setdefault is atomic, so concurrent first callers share one lock
+        load_lock = self.loading.setdefault(model_name, threading.Lock())
         
-        with self.loading[model_name]:
+        with load_lock:
             # Double-check after acquiring lock
             if model_name in self.models:
                 logger.info(f"[WHISPER CACHE] Model '{model_name}' loaded by another thread")
@@ -68,17 +116,13 @@ class WhisperModelCache:
             logger.info(f"[WHISPER CACHE] Loading model '{model_name}'...")
             logger.info(f"[WHISPER CACHE] This may take a while on first use (downloading model if needed)...")
             try:
-                import whisper
-                import time
-                import warnings
-                
                 load_start = time.time()
                 
                 # Suppress warnings during model loading
                 with warnings.catch_warnings():
                     warnings.filterwarnings("ignore", category=UserWarning)
                     warnings.filterwarnings("ignore", message=".*FP16.*")
-                    model = whisper.load_model(model_name)
+                    model = whisper_module.load_model(model_name)
                 
                 load_duration = time.time() - load_start
                 
@@ -95,6 +139,37 @@ class WhisperModelCache:
                 logger.exception("Full error details:")
                 raise
     
+    async def aget_model(self, model_name: str):
+        """
+        Async variant of get_model for callers running on an event loop.
+        
+        The blocking load runs in the default executor, so the event loop
+        keeps serving other requests while a model is loading. Concurrent
+        awaiters of the same model wait on an asyncio.Lock instead of
+        blocking the loop thread.
+        
+        Args:
+            model_name: Name of the Whisper model (tiny, base, small, medium, large)
+            
+        Returns:
+            Whisper model instance
+        """
+        if model_name in self.models:
+            logger.info(f"[WHISPER CACHE] Model '{model_name}' found in cache")
+            return self.models[model_name]
+        
+        with self._async_loading_guard:
+            load_lock = self._async_loading.setdefault(model_name, asyncio.Lock())
+        
+        async with load_lock:
+            if model_name in self.models:
+                return self.models[model_name]
+            
+            # get_model still holds the per-model thread lock, so async and
+            # sync callers never load the same model twice
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self.get_model, model_name)
+    
     def preload_model(self, model_name: str):
         """
         Preload a model in a background thread.
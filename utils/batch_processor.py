@@ -2,15 +2,63 @@
 Batch Processing Module
 Handles batch processing of multiple requests for OpenAI API.
 Supports efficient batch operations and request queuing.
+
+Diagnostics go through the module logger with lazy %-style arguments, so
+nothing is formatted unless the record is emitted. Callback failures carry
+the request id as the ``req_id`` record attribute. To keep log I/O off the
+worker threads, route this logger through a logging.handlers.QueueHandler
+drained by a logging.handlers.QueueListener.
 """
-from typing import List, Dict, Any, Optional, Callable
+from typing import List, Dict, Any, Optional, Callable, Awaitable, Tuple, Union
 from dataclasses import dataclass
 from datetime import datetime
 import asyncio
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import collections
+import json
+import logging
+import os
+import queue
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from utils.compat import DATACLASS_SLOTS
+
+logger = logging.getLogger(__name__)
+
+
+def iso_timestamp(timestamp_ns: int) -> str:
+    """
+    Format a result's timestamp_ns (time.time_ns()) as a local ISO 8601 string.
+    
+    Args:
+        timestamp_ns: Wall-clock time in nanoseconds since the epoch
+        
+    Returns:
+        ISO 8601 formatted timestamp
+    """
+    seconds, nanoseconds = divmod(timestamp_ns, 1_000_000_000)
+    return datetime.fromtimestamp(seconds).replace(microsecond=nanoseconds // 1000).isoformat()
+
+
+def _safe_call(callback: Callable[[Dict[str, Any]], Any], result_data: Dict[str, Any]) -> None:
+    """
+    Invoke a request callback, logging instead of raising on failure.
+    
+    Args:
+        callback: Callback registered with the request
+        result_data: Result dictionary passed to the callback
+    """
+    try:
+        callback(result_data)
+    except Exception:
+        request_id = result_data.get('id')
+        logger.exception(
+            "Error in callback for request %s", request_id,
+            extra={'req_id': request_id}
+        )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class BatchRequest:
     """
     Represents a single request in a batch.
@@ -19,17 +67,60 @@ class BatchRequest:
         id: Unique request identifier
         data: Request data
         callback: Optional callback function for result
-        timestamp: When the request was created
+        timestamp_ns: When the request was created (time.time_ns())
     """
     id: str
     data: Dict[str, Any]
     callback: Optional[Callable] = None
-    timestamp: datetime = None
+    timestamp_ns: int = 0
     
     def __post_init__(self):
         """Initialize timestamp if not provided."""
-        if self.timestamp is None:
-            self.timestamp = datetime.now()
+        if not self.timestamp_ns:
+            self.timestamp_ns = time.time_ns()
+    
+    @property
+    def timestamp(self) -> datetime:
+        """When the request was created, as a local datetime."""
+        seconds, nanoseconds = divmod(self.timestamp_ns, 1_000_000_000)
+        return datetime.fromtimestamp(seconds).replace(microsecond=nanoseconds // 1000)
+
+
+class ObjectPool:
+    """
+    Small pool of reusable objects to avoid allocation churn on hot paths.
+    
+    Only warm objects are pre-created; the pool grows to at most size as
+    objects come back. rent() hands out a pooled object or creates a new one
+    (counted as a miss); return_() puts it back unless the pool is full.
+    """
+    
+    def __init__(self, factory: Callable[[], Any], size: int, warm: int = 0):
+        """
+        Initialize ObjectPool.
+        
+        Args:
+            factory: Callable creating a fresh object
+            size: Maximum number of pooled objects
+            warm: Number of objects to pre-create (capped at size)
+        """
+        self._factory = factory
+        self._size = size
+        self._pool = collections.deque(factory() for _ in range(min(warm, size)))
+        self.misses = 0
+    
+    def rent(self) -> Any:
+        """Get an object from the pool, creating one if the pool is empty."""
+        try:
+            return self._pool.pop()
+        except IndexError:
+            self.misses += 1
+            return self._factory()
+    
+    def return_(self, obj: Any) -> None:
+        """Return an object to the pool (dropped if the pool is full)."""
+        if len(self._pool) < self._size:
+            self._pool.append(obj)
 
 
 class BatchProcessor:
@@ -38,25 +129,78 @@ class BatchProcessor:
     Supports configurable batch size and timeout.
     """
     
+    # Requests per worker in a batch when batch_size='auto'
+    AUTO_BATCH_FACTOR = 10
+    
+    # Request objects pre-created per processor; more are pooled only once
+    # they have actually been used (up to two batches' worth)
+    REQUEST_POOL_WARM_SIZE = 16
+    
+    # Processing modes: concurrent per-request calls, or one OpenAI Batch API job
+    MODES = ('concurrent', 'batch_api')
+    
+    # OpenAI Batch API settings
+    BATCH_API_ENDPOINT = '/v1/chat/completions'
+    BATCH_API_COMPLETION_WINDOW = '24h'
+    BATCH_API_MAX_REQUESTS = 50000
+    BATCH_API_TERMINAL_STATUSES = ('completed', 'failed', 'expired', 'cancelled')
+    
     def __init__(
         self,
-        batch_size: int = 10,
-        timeout: float = 30.0,
-        max_workers: int = 4
+        batch_size: Union[int, str] = 10,
+        timeout: Optional[float] = 30.0,
+        max_workers: Optional[int] = None,
+        mode: str = 'concurrent',
+        client: Optional[Any] = None,
+        poll_interval: float = 30.0
     ):
         """
         Initialize BatchProcessor.
         
         Args:
-            batch_size: Maximum number of requests per batch
-            timeout: Timeout in seconds for batch processing
-            max_workers: Maximum number of worker threads
+            batch_size: Maximum number of requests per batch, or 'auto' to use
+                max_workers * AUTO_BATCH_FACTOR so every batch saturates the pool
+            timeout: Timeout in seconds for each request, counted from when
+                a worker starts it (None waits without a timeout)
+            max_workers: Maximum number of worker threads (default: sized for
+                I/O-bound API calls, min(32, cpu_count * 5))
+            mode: 'concurrent' (default) runs processor_func per request on the
+                thread pool; 'batch_api' submits all pending requests as one
+                OpenAI Batch API job (for latency-tolerant workloads)
+            client: openai.OpenAI client, required for mode='batch_api'
+            poll_interval: Seconds between Batch API status checks
+            
+        Raises:
+            ValueError: If mode is unknown or batch_api mode has no client
         """
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown batch mode '{mode}', expected one of {self.MODES}")
+        if mode == 'batch_api' and client is None:
+            raise ValueError("mode='batch_api' requires an OpenAI client")
+        
+        if max_workers is None:
+            max_workers = min(32, (os.cpu_count() or 1) * 5)
+        if batch_size == 'auto':
+            batch_size = max_workers * self.AUTO_BATCH_FACTOR
+        
         self.batch_size = batch_size
         self.timeout = timeout
         self.max_workers = max_workers
+        self.mode = mode
+        self.client = client
+        self.poll_interval = poll_interval
         self.pending_requests: List[BatchRequest] = []
         self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        # Callbacks run on their own small pool, off the result collector
+        self._cb_executor = ThreadPoolExecutor(
+            max_workers=max(2, max_workers // 2),
+            thread_name_prefix='cb'
+        )
+        self._request_pool = ObjectPool(
+            lambda: BatchRequest(id='', data={}),
+            size=batch_size * 2,
+            warm=self.REQUEST_POOL_WARM_SIZE
+        )
     
     def add_request(
         self,
@@ -72,22 +216,29 @@ class BatchProcessor:
             data: Request data
             callback: Optional callback function for result
         """
-        request = BatchRequest(
-            id=request_id,
-            data=data,
-            callback=callback
-        )
+        request = self._request_pool.rent()
+        request.id = request_id
+        request.data = data
+        request.callback = callback
+        request.timestamp_ns = time.time_ns()
         self.pending_requests.append(request)
     
     def process_batch(
         self,
-        processor_func: Callable[[Dict[str, Any]], Any]
+        processor_func: Optional[Callable[[Dict[str, Any]], Any]] = None
     ) -> List[Dict[str, Any]]:
         """
         Process all pending requests in batches.
         
+        Callbacks are dispatched to a separate callback pool and may still be
+        running when this returns; shutdown() waits for them.
+        
+        In mode='batch_api' each request's data must be a chat completions
+        request body; processor_func is not used and the call blocks until
+        OpenAI finishes the batch job.
+        
         Args:
-            processor_func: Function to process each request
+            processor_func: Function to process each request (concurrent mode)
             
         Returns:
             List of results for all requests
@@ -95,6 +246,12 @@ class BatchProcessor:
         if not self.pending_requests:
             return []
         
+        if self.mode == 'batch_api':
+            return self._process_with_batch_api()
+        
+        if processor_func is None:
+            raise ValueError("processor_func is required in concurrent mode")
+        
         results: List[Dict[str, Any]] = []
         
         # Split requests into batches
@@ -103,16 +260,117 @@ class BatchProcessor:
             for i in range(0, len(self.pending_requests), self.batch_size)
         ]
         
-        # Process each batch
-        for batch in batches:
-            batch_results = self._process_single_batch(batch, processor_func)
-            results.extend(batch_results)
+        # Process each batch, submitting the next one before draining the
+        # current one so workers never sit idle between batches
+        next_submitted = self._submit_batch(batches[0], processor_func)
+        for i, batch in enumerate(batches):
+            submitted = next_submitted
+            if i + 1 < len(batches):
+                next_submitted = self._submit_batch(batches[i + 1], processor_func)
+            results.extend(self._collect_batch(batch, submitted))
         
         # Clear pending requests
+        self.clear_pending()
+        
+        return results
+    
+    async def aprocess_batch(
+        self,
+        processor_coro: Callable[[Dict[str, Any]], Awaitable[Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Process all pending requests concurrently on the running event loop.
+        
+        Async counterpart of process_batch for I/O-bound processors such as
+        calls through openai.AsyncOpenAI. Requests flow through a queue to
+        max_workers worker tasks with no batch boundaries, so a new request
+        starts as soon as any in-flight one finishes. Callbacks are handed to
+        the callback pool as each request completes and never block the loop.
+        
+        Args:
+            processor_coro: Coroutine function to process each request
+            
+        Returns:
+            List of results for all requests, in submission order
+        """
+        if not self.pending_requests:
+            return []
+        
+        batch = list(self.pending_requests)
         self.pending_requests.clear()
         
+        results: List[Optional[Dict[str, Any]]] = [None] * len(batch)
+        # Keep the queue about twice the worker count so workers always
+        # have the next request ready without buffering the whole backlog
+        request_queue: asyncio.Queue = asyncio.Queue(maxsize=self.max_workers * 2)
+        
+        async def worker():
+            while True:
+                index, request = await request_queue.get()
+                try:
+                    results[index] = await self._arun_request(request, processor_coro)
+                finally:
+                    request_queue.task_done()
+        
+        workers = [
+            asyncio.create_task(worker())
+            for _ in range(min(self.max_workers, len(batch)))
+        ]
+        try:
+            for index, request in enumerate(batch):
+                await request_queue.put((index, request))
+            await request_queue.join()
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+        
+        self._release_requests(batch)
+        
         return results
     
+    async def _arun_request(
+        self,
+        request: BatchRequest,
+        processor_coro: Callable[[Dict[str, Any]], Awaitable[Any]]
+    ) -> Dict[str, Any]:
+        """
+        Run one request through processor_coro and fire its callback.
+        
+        Args:
+            request: The batch request
+            processor_coro: Coroutine function to process the request
+            
+        Returns:
+            Result dictionary for the request
+        """
+        try:
+            result = await asyncio.wait_for(
+                processor_coro(request.data),
+                timeout=self.timeout
+            )
+        except asyncio.TimeoutError:
+            return self._error_result(request, self._timeout_message())
+        except Exception as e:
+            return self._error_result(request, str(e))
+        
+        return self._success_result(request, result)
+    
+    def process_batch_sync(
+        self,
+        processor_coro: Callable[[Dict[str, Any]], Awaitable[Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Run aprocess_batch to completion from synchronous code.
+        
+        Args:
+            processor_coro: Coroutine function to process each request
+            
+        Returns:
+            List of results for all requests
+        """
+        return asyncio.run(self.aprocess_batch(processor_coro))
+    
     def _process_single_batch(
         self,
         batch: List[BatchRequest],
@@ -128,53 +386,275 @@ class BatchProcessor:
         Returns:
             List of results
         """
-        results: List[Dict[str, Any]] = []
+        return self._collect_batch(batch, self._submit_batch(batch, processor_func))
+    
+    def _submit_batch(
+        self,
+        batch: List[BatchRequest],
+        processor_func: Callable[[Dict[str, Any]], Any]
+    ) -> Tuple[List[Future], 'queue.SimpleQueue']:
+        """
+        Submit a batch of requests to the executor.
+        
+        Every request reports on the returned event queue when a worker
+        starts it, as (index, start time), and when it finishes, as
+        (index, None). The collector can therefore time each request from
+        its own start rather than from submission.
+        
+        Args:
+            batch: List of batch requests
+            processor_func: Function to process each request
+            
+        Returns:
+            Tuple of (futures in batch order, event queue)
+        """
+        events: queue.SimpleQueue = queue.SimpleQueue()
+        
+        def run(index: int, data: Dict[str, Any]) -> Any:
+            events.put((index, time.monotonic()))
+            return processor_func(data)
+        
         futures = []
+        for index, request in enumerate(batch):
+            future = self.executor.submit(run, index, request.data)
+            future.add_done_callback(lambda _, index=index: events.put((index, None)))
+            futures.append(future)
         
-        # Submit all requests in batch
-        for request in batch:
-            future = self.executor.submit(processor_func, request.data)
-            futures.append((request, future))
+        return futures, events
+    
+    def _collect_batch(
+        self,
+        batch: List[BatchRequest],
+        submitted: Tuple[List[Future], 'queue.SimpleQueue']
+    ) -> List[Dict[str, Any]]:
+        """
+        Wait for a submitted batch and build its results.
+        
+        The timeout applies to each request separately and starts when a
+        worker picks the request up, so requests still waiting in the
+        executor queue (batch_size > max_workers) are not timed out.
         
-        # Collect results
-        for request, future in futures:
+        Args:
+            batch: List of batch requests
+            submitted: Futures and event queue returned by _submit_batch
+            
+        Returns:
+            List of results, in submission order
+        """
+        futures, events = submitted
+        results: List[Optional[Dict[str, Any]]] = [None] * len(batch)
+        # Deadlines of requests that are currently running
+        deadlines: Dict[int, float] = {}
+        remaining = len(batch)
+        
+        # Collect results as they complete so a slow request does not delay
+        # the callbacks of faster ones; results keep submission order
+        while remaining:
+            wait_time = None
+            if deadlines:
+                wait_time = max(0.0, min(deadlines.values()) - time.monotonic())
+            
             try:
-                result = future.result(timeout=self.timeout)
-                result_data = {
-                    "id": request.id,
-                    "success": True,
-                    "data": result,
-                    "timestamp": datetime.now().isoformat()
-                }
-                
-                # Call callback if provided
-                if request.callback:
-                    try:
-                        request.callback(result_data)
-                    except Exception as e:
-                        print(f"Error in callback for request {request.id}: {e}")
-                
-                results.append(result_data)
-            except Exception as e:
-                error_data = {
-                    "id": request.id,
-                    "success": False,
-                    "error": str(e),
-                    "timestamp": datetime.now().isoformat()
-                }
-                results.append(error_data)
+                index, started_at = events.get(timeout=wait_time)
+            except queue.Empty:
+                now = time.monotonic()
+                for index, deadline in list(deadlines.items()):
+                    if deadline <= now:
+                        del deadlines[index]
+                        futures[index].cancel()
+                        results[index] = self._error_result(batch[index], self._timeout_message())
+                        remaining -= 1
+                continue
+            
+            if results[index] is not None:
+                # Finished after it was already reported as timed out
+                continue
+            if started_at is not None:
+                # timeout=None means no deadline (wait until it finishes)
+                if self.timeout is not None:
+                    deadlines[index] = started_at + self.timeout
+            else:
+                deadlines.pop(index, None)
+                results[index] = self._collect_result(batch[index], futures[index])
+                remaining -= 1
+        
+        return results
+    
+    def _collect_result(self, request: BatchRequest, future: Future) -> Dict[str, Any]:
+        """
+        Build the result entry for a completed request and fire its callback.
+        
+        Args:
+            request: The batch request
+            future: Completed future for the request
+            
+        Returns:
+            Result dictionary for the request
+        """
+        try:
+            result = future.result()
+        except Exception as e:
+            return self._error_result(request, str(e))
+        
+        return self._success_result(request, result)
+    
+    def _success_result(self, request: BatchRequest, data: Any) -> Dict[str, Any]:
+        """
+        Build the result entry for a successful request and fire its callback.
+        
+        Args:
+            request: The batch request
+            data: Value produced for the request
+            
+        Returns:
+            Result dictionary for the request
+        """
+        result_data = {
+            "id": request.id,
+            "success": True,
+            "data": data,
+            "timestamp_ns": time.time_ns()
+        }
+        
+        # Run callback on the callback pool so a slow callback does not hold
+        # up collecting the remaining results
+        if request.callback:
+            self._cb_executor.submit(_safe_call, request.callback, result_data)
+        
+        return result_data
+    
+    def _error_result(self, request: BatchRequest, message: str) -> Dict[str, Any]:
+        """
+        Build the result entry for a failed request.
+        
+        Args:
+            request: The batch request
+            message: Error description
+            
+        Returns:
+            Result dictionary for the request
+        """
+        return {
+            "id": request.id,
+            "success": False,
+            "error": message,
+            "timestamp_ns": time.time_ns()
+        }
+    
+    def _timeout_message(self) -> str:
+        """Error message for a request that exceeded the timeout."""
+        return f"Request timed out after {self.timeout} seconds"
+    
+    def _process_with_batch_api(self) -> List[Dict[str, Any]]:
+        """
+        Process all pending requests through the OpenAI Batch API.
+        
+        Requests are sent as one JSONL upload per job (split at
+        BATCH_API_MAX_REQUESTS) instead of one HTTP call each.
+        
+        Returns:
+            List of results for all requests, in submission order
+        """
+        results: List[Dict[str, Any]] = []
+        requests = self.pending_requests
+        for i in range(0, len(requests), self.BATCH_API_MAX_REQUESTS):
+            results.extend(
+                self._run_batch_api_job(requests[i:i + self.BATCH_API_MAX_REQUESTS])
+            )
+        
+        self.clear_pending()
+        
+        return results
+    
+    def _run_batch_api_job(self, batch: List[BatchRequest]) -> List[Dict[str, Any]]:
+        """
+        Submit one Batch API job, wait for it and map its output back to requests.
+        
+        Args:
+            batch: List of batch requests (ids must be unique)
+            
+        Returns:
+            List of results, in submission order
+        """
+        payload = "\n".join(
+            json.dumps({
+                "custom_id": request.id,
+                "method": "POST",
+                "url": self.BATCH_API_ENDPOINT,
+                "body": request.data
+            }, ensure_ascii=False)
+            for request in batch
+        )
+        
+        try:
+            input_file = self.client.files.create(
+                file=("batch_input.jsonl", payload.encode('utf-8')),
+                purpose='batch'
+            )
+            job = self.client.batches.create(
+                input_file_id=input_file.id,
+                endpoint=self.BATCH_API_ENDPOINT,
+                completion_window=self.BATCH_API_COMPLETION_WINDOW
+            )
+            logger.info("Submitted Batch API job %s with %d requests", job.id, len(batch))
+            
+            while job.status not in self.BATCH_API_TERMINAL_STATUSES:
+                time.sleep(self.poll_interval)
+                job = self.client.batches.retrieve(job.id)
+            
+            outputs: Dict[str, Dict[str, Any]] = {}
+            for file_id in (job.output_file_id, job.error_file_id):
+                if file_id:
+                    for line in self.client.files.content(file_id).text.splitlines():
+                        if line.strip():
+                            entry = json.loads(line)
+                            outputs[entry.get("custom_id")] = entry
+        except Exception as e:
+            logger.exception("Batch API job failed")
+            return [self._error_result(request, f"Batch API error: {e}") for request in batch]
+        
+        logger.info("Batch API job %s finished with status %s", job.id, job.status)
+        
+        results: List[Dict[str, Any]] = []
+        for request in batch:
+            entry = outputs.get(request.id)
+            response = (entry or {}).get("response") or {}
+            
+            if entry is None:
+                error = f"No result returned (batch status: {job.status})"
+            elif entry.get("error"):
+                error = str(entry["error"].get("message") or entry["error"])
+            elif response.get("status_code") != 200:
+                error = f"Request failed with status {response.get('status_code')}"
+            else:
+                error = None
+            
+            if error is not None:
+                results.append(self._error_result(request, error))
+            else:
+                results.append(self._success_result(request, response.get("body")))
         
         return results
     
     def clear_pending(self) -> None:
         """Clear all pending requests."""
+        self._release_requests(self.pending_requests)
         self.pending_requests.clear()
     
+    def _release_requests(self, requests: List[BatchRequest]) -> None:
+        """Reset processed requests and return them to the request pool."""
+        for request in requests:
+            request.data = {}
+            request.callback = None
+            self._request_pool.return_(request)
+    
     def get_pending_count(self) -> int:
         """Get number of pending requests."""
         return len(self.pending_requests)
     
     def shutdown(self) -> None:
-        """Shutdown the batch processor and executor."""
+        """Shutdown the batch processor and executors, waiting for pending callbacks."""
         self.executor.shutdown(wait=True)
+        self._cb_executor.shutdown(wait=True)
+        logger.info("BatchProcessor request pool misses: %d", self._request_pool.misses)
 
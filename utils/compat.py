@@ -0,0 +1,9 @@
+"""
+Compatibility Module
+Version-dependent settings shared by the utility modules.
+"""
+import sys
+
+# Keyword arguments for @dataclass: slotted dataclasses (no per-instance
+# __dict__) need Python 3.10+, older versions keep __dict__ storage
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
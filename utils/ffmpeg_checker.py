@@ -3,7 +3,9 @@ FFmpeg Checker Utility
 Centralized utility for checking FFmpeg availability.
 Follows DRY principle - single source of truth for FFmpeg checks.
 """
+import shutil
 import subprocess
+import threading
 import logging
 from typing import Optional
 
@@ -12,18 +14,15 @@ logger = logging.getLogger(__name__)
 
 class FFmpegChecker:
     """
-    Singleton utility for checking FFmpeg availability.
-    Caches the result to avoid repeated subprocess calls.
+    Utility for checking FFmpeg availability.
+    Caches the result to avoid repeated PATH lookups.
+    Use the shared FFMPEG_CHECKER instance (or get_ffmpeg_checker()).
     """
     
-    _instance = None
-    _ffmpeg_available: Optional[bool] = None
-    
-    def __new__(cls):
-        """Singleton pattern implementation."""
-        if cls._instance is None:
-            cls._instance = super(FFmpegChecker, cls).__new__(cls)
-        return cls._instance
+    def __init__(self):
+        """Initialize FFmpegChecker."""
+        self._ffmpeg_available: Optional[bool] = None
+        self._check_lock = threading.Lock()
     
     def is_available(self) -> bool:
         """
@@ -34,17 +33,35 @@ class FFmpegChecker:
             True if FFmpeg is available, False otherwise
         """
         if self._ffmpeg_available is None:
-            self._ffmpeg_available = self._check_ffmpeg()
+            # Lock so concurrent first callers run the lookup only once
+            with self._check_lock:
+                if self._ffmpeg_available is None:
+                    self._ffmpeg_available = self._check_ffmpeg()
         
         return self._ffmpeg_available
     
     def _check_ffmpeg(self) -> bool:
         """
-        Actually check FFmpeg availability by running a command.
+        Check FFmpeg availability by looking up the executable on PATH.
+        Does not spawn a process; use verify_working() for that.
         
         Returns:
             True if FFmpeg is available, False otherwise
         """
+        if shutil.which('ffmpeg') is not None:
+            logger.info("FFmpeg is available")
+            return True
+        
+        logger.warning("FFmpeg is not available: not found on PATH")
+        return False
+    
+    def verify_working(self) -> bool:
+        """
+        Check that FFmpeg actually runs by invoking 'ffmpeg -version'.
+        
+        Returns:
+            True if FFmpeg runs successfully, False otherwise
+        """
         try:
             subprocess.run(
                 ['ffmpeg', '-version'],
@@ -52,7 +69,7 @@ class FFmpegChecker:
                 stderr=subprocess.PIPE,
                 timeout=5
             )
-            logger.info("FFmpeg is available")
+            logger.info("FFmpeg is working")
             return True
         except (subprocess.TimeoutExpired, FileNotFoundError, OSError) as e:
             logger.warning(f"FFmpeg is not available: {type(e).__name__}")
@@ -86,13 +103,10 @@ class FFmpegChecker:
         logger.info("FFmpeg cache reset")
 
 
-# Global singleton instance
-_ffmpeg_checker = None
+# Global shared instance, created at import so there is no first-use race
+FFMPEG_CHECKER = FFmpegChecker()
 
 def get_ffmpeg_checker() -> FFmpegChecker:
     """Get the global FFmpegChecker instance."""
-    global _ffmpeg_checker
-    if _ffmpeg_checker is None:
-        _ffmpeg_checker = FFmpegChecker()
-    return _ffmpeg_checker
+    return FFMPEG_CHECKER
 
@@ -5,10 +5,119 @@ Supports structured function definitions and execution.
 """
 from typing import Dict, Any, List, Callable, Optional
 from dataclasses import dataclass, field
+import dataclasses
+import datetime
+import enum
 import json
+import sys
+import uuid
 
+from utils.compat import DATACLASS_SLOTS
 
-@dataclass
+# orjson is optional: a C-extension serializer that is much faster than the
+# stdlib json module for large handler results
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_default(obj: Any) -> Any:
+    """
+    Convert the non-JSON types orjson serializes natively for json.dumps.
+    
+    Args:
+        obj: Object json.dumps could not serialize
+        
+    Returns:
+        JSON-serializable equivalent (same representation as orjson)
+        
+    Raises:
+        TypeError: If the type is not supported by orjson either
+    """
+    if isinstance(obj, (datetime.datetime, datetime.date, datetime.time)):
+        return obj.isoformat()
+    if isinstance(obj, enum.Enum):
+        return obj.value
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: getattr(obj, f.name) for f in dataclasses.fields(obj)}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps(obj: Any) -> str:
+    """
+    Serialize a function result to a compact JSON string.
+    Uses orjson when installed; the stdlib fallback produces the same output
+    (compact separators, non-ASCII kept, datetime/date/time, enum, UUID and
+    dataclass values), so results do not depend on the environment.
+    
+    Args:
+        obj: Object to serialize
+        
+    Returns:
+        JSON string
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+        except TypeError:
+            # Types orjson can't handle (e.g. ints above 64 bits) - use stdlib
+            pass
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':'), default=_json_default)
+
+
+class _FrozenDict(dict):
+    """
+    Read-only dict used for function schemas.
+    
+    Subclasses dict (rather than wrapping in types.MappingProxyType) so the
+    schemas still serialize with json/orjson and pass the OpenAI client's
+    mapping checks. Copying returns the same object since it cannot change.
+    """
+    
+    __slots__ = ()
+    
+    def _readonly(self, *args, **kwargs):
+        raise TypeError(f"'{type(self).__name__}' object is read-only")
+    
+    __setitem__ = __delitem__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+    __ior__ = _readonly
+    
+    def __copy__(self):
+        return self
+    
+    def __deepcopy__(self, memo):
+        return self
+    
+    def __reduce__(self):
+        return (type(self), (dict(self),))
+
+
+def _freeze(value: Any) -> Any:
+    """
+    Recursively freeze a JSON-style schema.
+    Dicts become read-only with interned string keys and lists become tuples.
+    
+    Args:
+        value: Schema value (dict, list or scalar)
+        
+    Returns:
+        Frozen equivalent of value
+    """
+    if isinstance(value, dict):
+        return _FrozenDict(
+            (sys.intern(key) if isinstance(key, str) else key, _freeze(item))
+            for key, item in value.items()
+        )
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+@dataclass(**DATACLASS_SLOTS)
 class FunctionParameter:
     """
     Represents a parameter in a function definition.
@@ -25,9 +134,18 @@ class FunctionParameter:
     enum: Optional[List[Any]] = None
     properties: Optional[Dict[str, Any]] = None
     required: Optional[bool] = None
+    _dict: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        """Serialize once; parameters are treated as immutable after construction."""
+        self._dict = self._build_dict()
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert parameter to dictionary format."""
+        return self._dict
+    
+    def _build_dict(self) -> Dict[str, Any]:
+        """Build the dictionary representation of the parameter."""
         param_dict: Dict[str, Any] = {
             "type": self.type,
             "description": self.description
@@ -45,7 +163,7 @@ class FunctionParameter:
         return param_dict
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class FunctionDefinition:
     """
     Represents a function definition for OpenAI function calling.
@@ -60,19 +178,23 @@ class FunctionDefinition:
     description: str
     parameters: Dict[str, Any]
     handler: Optional[Callable] = None
+    _dict: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
     
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert function definition to OpenAI API format.
+        The result is built once and reused on later calls.
         
         Returns:
             Dictionary in OpenAI function calling format
         """
-        return {
-            "name": self.name,
-            "description": self.description,
-            "parameters": self.parameters
-        }
+        if self._dict is None:
+            self._dict = {
+                "name": self.name,
+                "description": self.description,
+                "parameters": self.parameters
+            }
+        return self._dict
 
 
 class FunctionRegistry:
@@ -84,6 +206,8 @@ class FunctionRegistry:
     def __init__(self):
         """Initialize FunctionRegistry."""
         self.functions: Dict[str, FunctionDefinition] = {}
+        # Serialized definitions, rebuilt only when a function is registered
+        self._definitions_cache: List[Dict[str, Any]] = []
         self._register_default_functions()
     
     def register_function(
@@ -99,16 +223,18 @@ class FunctionRegistry:
         Args:
             name: Function name
             description: Function description
-            parameters: Function parameters schema (JSON Schema format)
+            parameters: Function parameters schema (JSON Schema format);
+                stored as a read-only copy
             handler: Optional handler function to execute
         """
         func_def = FunctionDefinition(
             name=name,
             description=description,
-            parameters=parameters,
+            parameters=_freeze(parameters),
             handler=handler
         )
         self.functions[name] = func_def
+        self._definitions_cache = [func.to_dict() for func in self.functions.values()]
     
     def get_function_definitions(self) -> List[Dict[str, Any]]:
         """
@@ -117,7 +243,7 @@ class FunctionRegistry:
         Returns:
             List of function definition dictionaries
         """
-        return [func.to_dict() for func in self.functions.values()]
+        return list(self._definitions_cache)
     
     def execute_function(
         self,
@@ -144,7 +270,7 @@ class FunctionRegistry:
         
         if func_def.handler is None:
             # No handler registered, return arguments as result
-            return json.dumps(arguments, ensure_ascii=False)
+            return _dumps(arguments)
         
         try:
             # Execute handler function
@@ -154,7 +280,7 @@ class FunctionRegistry:
             if isinstance(result, str):
                 return result
             else:
-                return json.dumps(result, ensure_ascii=False)
+                return _dumps(result)
         except Exception as e:
             raise ValueError(f"Error executing function '{name}': {str(e)}")
     
@@ -203,8 +329,8 @@ class FunctionRegistry:
         )
 
 
-# Mock data schema for meeting summaries
-MEETING_SUMMARY_SCHEMA = {
+# Mock data schema for meeting summaries (read-only)
+MEETING_SUMMARY_SCHEMA = _freeze({
     "type": "object",
     "properties": {
         "topic": {
@@ -249,5 +375,5 @@ MEETING_SUMMARY_SCHEMA = {
         }
     },
     "required": ["topic", "key_points"]
-}
+})
 
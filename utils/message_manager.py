@@ -3,12 +3,16 @@ Message Management Module
 Handles conversation history and message management for multi-turn dialogues.
 Provides context-aware message handling for OpenAI API.
 """
-from typing import List, Dict, Any, Optional
+from typing import Deque, Iterator, List, Dict, Any, Optional
 from dataclasses import dataclass, field
 from datetime import datetime
+import collections
+import itertools
+import time
 
+from utils.compat import DATACLASS_SLOTS
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Message:
     """
     Represents a single message in a conversation.
@@ -18,21 +22,33 @@ class Message:
         content: Message content
         name: Optional name for function calls
         function_call: Optional function call data
-        timestamp: When the message was created
+        seq: Monotonic creation time (time.perf_counter_ns()), used for ordering
+        created_ns: Wall-clock creation time (time.time_ns()), used for display
     """
     role: str  # 'system', 'user', 'assistant', 'function'
     content: str
     name: Optional[str] = None
     function_call: Optional[Dict[str, Any]] = None
-    timestamp: datetime = field(default_factory=datetime.now)
+    seq: int = field(default_factory=time.perf_counter_ns)
+    created_ns: int = field(default_factory=time.time_ns)
+    _dict: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    
+    @property
+    def timestamp(self) -> datetime:
+        """When the message was created, as local wall-clock time (computed on access)."""
+        return datetime.fromtimestamp(self.created_ns / 1_000_000_000)
     
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert message to dictionary format for OpenAI API.
+        Messages are immutable once added, so the dictionary is built once.
         
         Returns:
             Dictionary representation of the message
         """
+        if self._dict is not None:
+            return self._dict
+        
         message_dict: Dict[str, Any] = {
             "role": self.role,
             "content": self.content
@@ -44,6 +60,7 @@ class Message:
         if self.function_call:
             message_dict["function_call"] = self.function_call
         
+        self._dict = message_dict
         return message_dict
 
 
@@ -60,9 +77,14 @@ class MessageManager:
         Args:
             max_history: Maximum number of messages to keep in history
         """
-        self.messages: List[Message] = []
+        # deque drops the oldest message in O(1) once max_history is reached
+        self.messages: Deque[Message] = collections.deque(maxlen=max_history)
         self.max_history = max_history
         self.system_message: Optional[Message] = None
+        # API dicts kept in step with self.messages (same maxlen, so both
+        # drop their oldest entry together)
+        self._api_cache: Deque[Dict[str, Any]] = collections.deque(maxlen=max_history)
+        self._system_dict: Optional[Dict[str, Any]] = None
     
     def set_system_message(self, content: str) -> None:
         """
@@ -73,24 +95,26 @@ class MessageManager:
         """
         self.system_message = Message(
             role="system",
-            content=content,
-            timestamp=datetime.now()
+            content=content
         )
+        self._system_dict = self.system_message.to_dict()
     
     def add_user_message(self, content: str) -> None:
         """
         Add a user message to the conversation.
         
         Args:
-            content: User message content
+            content: User message content (ignored if empty)
         """
+        if not content:
+            return
+        
         message = Message(
             role="user",
-            content=content,
-            timestamp=datetime.now()
+            content=content
         )
         self.messages.append(message)
-        self._trim_history()
+        self._api_cache.append(message.to_dict())
     
     def add_assistant_message(
         self,
@@ -103,15 +127,19 @@ class MessageManager:
         Args:
             content: Assistant message content
             function_call: Optional function call data
+        
+        Messages with neither content nor a function call are ignored.
         """
+        if not content and not function_call:
+            return
+        
         message = Message(
             role="assistant",
             content=content,
-            function_call=function_call,
-            timestamp=datetime.now()
+            function_call=function_call
         )
         self.messages.append(message)
-        self._trim_history()
+        self._api_cache.append(message.to_dict())
     
     def add_function_message(self, name: str, content: str) -> None:
         """
@@ -124,11 +152,10 @@ class MessageManager:
         message = Message(
             role="function",
             content=content,
-            name=name,
-            timestamp=datetime.now()
+            name=name
         )
         self.messages.append(message)
-        self._trim_history()
+        self._api_cache.append(message.to_dict())
     
     def get_messages_for_api(self) -> List[Dict[str, Any]]:
         """
@@ -138,17 +165,25 @@ class MessageManager:
         Returns:
             List of message dictionaries
         """
-        api_messages: List[Dict[str, Any]] = []
-        
-        # Add system message first if exists
-        if self.system_message:
-            api_messages.append(self.system_message.to_dict())
+        # System message first if exists, then cached conversation dicts
+        if self._system_dict is not None:
+            return [self._system_dict, *self._api_cache]
+        return list(self._api_cache)
+    
+    def iter_messages_for_api(self) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over messages in format suitable for OpenAI API without
+        building a list. Includes system message if set.
         
-        # Add conversation messages
-        for message in self.messages:
-            api_messages.append(message.to_dict())
+        The iterator reads the live history, so consume it (e.g. by passing
+        it as messages= to the API call) before adding further messages.
         
-        return api_messages
+        Returns:
+            Iterator of message dictionaries
+        """
+        if self._system_dict is not None:
+            return itertools.chain((self._system_dict,), self._api_cache)
+        return iter(self._api_cache)
     
     def get_recent_messages(self, count: int = 10) -> List[Message]:
         """
@@ -160,22 +195,20 @@ class MessageManager:
         Returns:
             List of recent messages
         """
-        return self.messages[-count:] if len(self.messages) > count else self.messages
+        start = max(0, len(self.messages) - count)
+        return list(itertools.islice(self.messages, start, None))
     
     def clear_history(self) -> None:
         """Clear conversation history (but keep system message)."""
         self.messages.clear()
+        self._api_cache.clear()
     
     def clear_all(self) -> None:
         """Clear all messages including system message."""
         self.messages.clear()
+        self._api_cache.clear()
         self.system_message = None
-    
-    def _trim_history(self) -> None:
-        """Trim message history if it exceeds max_history."""
-        if len(self.messages) > self.max_history:
-            # Keep system message and recent messages
-            self.messages = self.messages[-self.max_history:]
+        self._system_dict = None
     
     def get_conversation_summary(self) -> str:
         """
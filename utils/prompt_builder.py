@@ -3,91 +3,38 @@ Prompt Builder Module
 Builds optimized prompts for AI summarization with well-crafted templates.
 Supports multiple languages and contexts with structured output.
 """
+import functools
 from typing import Tuple, Optional
 from config import LANGUAGE_NAMES
 
 
-class PromptBuilder:
-    """
-    Builder for creating optimized AI prompts.
-    Provides well-crafted prompt templates for various use cases.
-    """
-    
-    def __init__(self):
-        """Initialize PromptBuilder."""
-        pass
-    
-    def _get_language_name(
-        self,
-        language: str,
-        custom_language: Optional[str] = None
-    ) -> str:
-        """
-        Get display name for language.
-        
-        Args:
-            language: Language code (e.g., 'vi', 'en', 'zh')
-            custom_language: Custom language name if language is "other"
-            
-        Returns:
-            Language display name (e.g., 'Vietnamese', 'English')
-        """
-        if language == 'other' and custom_language:
-            return custom_language
-        return LANGUAGE_NAMES.get(language, 'the language used')
-    
-    def build_summary_prompt(
-        self,
-        transcript: str,
-        topic: Optional[str] = None,
-        language: str = 'en',
-        custom_language: Optional[str] = None
-    ) -> Tuple[str, str]:
-        """
-        Build optimized prompt for meeting summarization.
-        
-        This method creates well-structured prompts that:
-        - Preserve technical terminology and proper nouns
-        - Focus on key decisions and action items
-        - Maintain context and clarity
-        - Support multiple languages
-        
-        Args:
-            transcript: The transcribed text to summarize
-            topic: Optional topic/context for better summarization
-            language: Language code for output (default: 'en')
-            custom_language: Custom language name if language is "other"
-            
-        Returns:
-            Tuple of (system_message, user_prompt) ready for OpenAI API
-        """
-        language_name = self._get_language_name(language, custom_language)
-        
-        # Build comprehensive system message with clear instructions
-        # This sets the AI's role and behavior for the conversation
-        system_message = (
-            f"You are a professional meeting assistant specialized in creating "
-            f"concise, accurate, and well-structured summaries.\n\n"
-            f"Your summaries must:\n"
-            f"- Always be written in {language_name}\n"
-            f"- Preserve ALL technical terms, proper nouns, company names, "
-            f"product names, and domain-specific terminology exactly as they appear\n"
-            f"- NEVER translate technical terms, proper nouns, or brand names\n"
-            f"- Focus on key decisions, action items, important discussions, and outcomes\n"
-            f"- Maintain clarity and structure while being concise\n"
-            f"- Use proper formatting with clear sections and bullet points when appropriate\n"
-            f"- Include deadlines, responsibilities, and next steps when mentioned"
-        )
-        
-        # Build user prompt with context-aware instructions
-        # Include topic if provided for better context understanding
-        if topic:
-            user_prompt = f"""Please provide a comprehensive summary of the following meeting transcript.
-
-MEETING TOPIC/CONTEXT: {topic}
+# Prompt templates - static text is defined once at import time and only the
+# language, topic and transcript are filled in per call. Templates use
+# %-style placeholders, which CPython substitutes faster than str.format
+
+# System message for meeting summarization
+# This sets the AI's role and behavior for the conversation
+SUMMARY_SYSTEM_TEMPLATE = (
+    "You are a professional meeting assistant specialized in creating "
+    "concise, accurate, and well-structured summaries.\n\n"
+    "Your summaries must:\n"
+    "- Always be written in %(language_name)s\n"
+    "- Preserve ALL technical terms, proper nouns, company names, "
+    "product names, and domain-specific terminology exactly as they appear\n"
+    "- NEVER translate technical terms, proper nouns, or brand names\n"
+    "- Focus on key decisions, action items, important discussions, and outcomes\n"
+    "- Maintain clarity and structure while being concise\n"
+    "- Use proper formatting with clear sections and bullet points when appropriate\n"
+    "- Include deadlines, responsibilities, and next steps when mentioned"
+)
+
+# User prompt when a meeting topic is provided for better context understanding
+SUMMARY_USER_TEMPLATE_WITH_TOPIC = """Please provide a comprehensive summary of the following meeting transcript.
+
+MEETING TOPIC/CONTEXT: %(topic)s
 
 CRITICAL INSTRUCTIONS:
-- Write the summary in {language_name}
+- Write the summary in %(language_name)s
 - Preserve ALL technical terms, jargon, and domain-specific vocabulary exactly as they appear
 - Do NOT translate technical terms, proper nouns, company names, or product names
 - Maintain the original terminology even if it's in a different language
@@ -98,15 +45,16 @@ CRITICAL INSTRUCTIONS:
 
 Meeting Transcript:
 ---
-{transcript}
+%(transcript)s
 ---
 
 Please provide the summary now:"""
-        else:
-            user_prompt = f"""Please provide a comprehensive summary of the following meeting transcript.
+
+# User prompt when no meeting topic is provided
+SUMMARY_USER_TEMPLATE_NO_TOPIC = """Please provide a comprehensive summary of the following meeting transcript.
 
 CRITICAL INSTRUCTIONS:
-- Write the summary in {language_name}
+- Write the summary in %(language_name)s
 - Preserve ALL technical terms, proper nouns, company names, and product names exactly as they appear
 - Do NOT translate technical terms or proper nouns
 - Focus on key decisions, action items, important discussions, and outcomes
@@ -115,57 +63,28 @@ CRITICAL INSTRUCTIONS:
 
 Meeting Transcript:
 ---
-{transcript}
+%(transcript)s
 ---
 
 Please provide the summary now:"""
-        
-        return system_message, user_prompt
-    
-    def build_structured_summary_prompt(
-        self,
-        transcript: str,
-        topic: Optional[str] = None,
-        language: str = 'en',
-        custom_language: Optional[str] = None
-    ) -> Tuple[str, str]:
-        """
-        Build prompt for structured summary output.
-        
-        This creates prompts that request structured output with specific sections:
-        - Key Points
-        - Decisions
-        - Action Items
-        - Next Steps
-        
-        Args:
-            transcript: The transcribed text to summarize
-            topic: Optional topic/context
-            language: Language code for output
-            custom_language: Custom language name if language is "other"
-            
-        Returns:
-            Tuple of (system_message, user_prompt) for structured output
-        """
-        language_name = self._get_language_name(language, custom_language)
-        
-        system_message = (
-            f"You are a professional meeting assistant that creates structured summaries.\n\n"
-            f"Your summaries must be written in {language_name} and include:\n"
-            f"1. Key Points: Main discussion topics and important information\n"
-            f"2. Decisions: Decisions made during the meeting\n"
-            f"3. Action Items: Tasks assigned with assignees and deadlines\n"
-            f"4. Next Steps: Follow-up actions and future plans\n\n"
-            f"Preserve all technical terms and proper nouns exactly as they appear."
-        )
-        
-        topic_context = f"\nMEETING TOPIC: {topic}\n" if topic else ""
-        
-        user_prompt = f"""Please provide a structured summary of the following meeting transcript.{topic_context}
+
+# System message for structured summary output
+STRUCTURED_SYSTEM_TEMPLATE = (
+    "You are a professional meeting assistant that creates structured summaries.\n\n"
+    "Your summaries must be written in %(language_name)s and include:\n"
+    "1. Key Points: Main discussion topics and important information\n"
+    "2. Decisions: Decisions made during the meeting\n"
+    "3. Action Items: Tasks assigned with assignees and deadlines\n"
+    "4. Next Steps: Follow-up actions and future plans\n\n"
+    "Preserve all technical terms and proper nouns exactly as they appear."
+)
+
+# User prompt for structured summary output
+STRUCTURED_USER_TEMPLATE = """Please provide a structured summary of the following meeting transcript.%(topic_context)s
 
 Meeting Transcript:
 ---
-{transcript}
+%(transcript)s
 ---
 
 Please provide the summary in the following structure:
@@ -173,6 +92,171 @@ Please provide the summary in the following structure:
 2. Decisions
 3. Action Items
 4. Next Steps"""
-        
-        return system_message, user_prompt
 
+
+@functools.lru_cache(maxsize=64)
+def get_language_name(language: str, custom_language: Optional[str] = None) -> str:
+    """
+    Get display name for language (cached).
+    
+    Args:
+        language: Language code (e.g., 'vi', 'en', 'zh')
+        custom_language: Custom language name if language is "other"
+    
+    Returns:
+        Language display name (e.g., 'Vietnamese', 'English')
+    """
+    if language == 'other' and custom_language:
+        return custom_language
+    return LANGUAGE_NAMES.get(language, 'the language used')
+
+
+@functools.lru_cache(maxsize=32)
+def _summary_system_message(language_name: str) -> str:
+    """Build the summarization system message for a language (cached)."""
+    return SUMMARY_SYSTEM_TEMPLATE % {'language_name': language_name}
+
+
+@functools.lru_cache(maxsize=32)
+def _structured_system_message(language_name: str) -> str:
+    """Build the structured summary system message for a language (cached)."""
+    return STRUCTURED_SYSTEM_TEMPLATE % {'language_name': language_name}
+
+
+@functools.lru_cache(maxsize=32)
+def _summary_user_templates(language_name: str) -> Tuple[str, str]:
+    """
+    Specialize the summary user templates for a language (cached).
+    
+    The language name is substituted ahead of time (with '%' escaped) so a
+    call only fills in the topic and transcript.
+    
+    Args:
+        language_name: Display name of the output language
+    
+    Returns:
+        Tuple of (template_with_topic, template_no_topic)
+    """
+    fields = {
+        'language_name': language_name.replace('%', '%%'),
+        'topic': '%(topic)s',
+        'transcript': '%(transcript)s'
+    }
+    return (
+        SUMMARY_USER_TEMPLATE_WITH_TOPIC % fields,
+        SUMMARY_USER_TEMPLATE_NO_TOPIC % fields
+    )
+
+
+# Every built-in language name is known at import time, so its messages and
+# templates are specialized once here (keyed by language name; unknown codes
+# resolve to the 'other' name). The lru caches above only see custom names
+_LANGUAGE_NAMES_BUILTIN = frozenset(LANGUAGE_NAMES.values())
+_SYS_MSG_BY_LANG = {
+    name: _summary_system_message.__wrapped__(name) for name in _LANGUAGE_NAMES_BUILTIN
+}
+_STRUCTURED_SYS_MSG_BY_LANG = {
+    name: _structured_system_message.__wrapped__(name) for name in _LANGUAGE_NAMES_BUILTIN
+}
+_USER_TEMPLATES_BY_LANG = {
+    name: _summary_user_templates.__wrapped__(name) for name in _LANGUAGE_NAMES_BUILTIN
+}
+
+
+def build_summary_prompt(
+    transcript: str,
+    topic: Optional[str] = None,
+    language: str = 'en',
+    custom_language: Optional[str] = None
+) -> Tuple[str, str]:
+    """
+    Build optimized prompt for meeting summarization.
+    
+    This function creates well-structured prompts that:
+    - Preserve technical terminology and proper nouns
+    - Focus on key decisions and action items
+    - Maintain context and clarity
+    - Support multiple languages
+    
+    Args:
+        transcript: The transcribed text to summarize
+        topic: Optional topic/context for better summarization
+        language: Language code for output (default: 'en')
+        custom_language: Custom language name if language is "other"
+    
+    Returns:
+        Tuple of (system_message, user_prompt) ready for OpenAI API
+    """
+    language_name = get_language_name(language, custom_language)
+    
+    system_message = _SYS_MSG_BY_LANG.get(language_name)
+    templates = _USER_TEMPLATES_BY_LANG.get(language_name)
+    if system_message is None:
+        system_message = _summary_system_message(language_name)
+        templates = _summary_user_templates(language_name)
+    template_with_topic, template_no_topic = templates
+    
+    # Include topic if provided for better context understanding
+    if topic:
+        user_prompt = template_with_topic % {
+            'topic': topic,
+            'transcript': transcript
+        }
+    else:
+        user_prompt = template_no_topic % {'transcript': transcript}
+    
+    return system_message, user_prompt
+
+
+def build_structured_summary_prompt(
+    transcript: str,
+    topic: Optional[str] = None,
+    language: str = 'en',
+    custom_language: Optional[str] = None
+) -> Tuple[str, str]:
+    """
+    Build prompt for structured summary output.
+    
+    This creates prompts that request structured output with specific sections:
+    - Key Points
+    - Decisions
+    - Action Items
+    - Next Steps
+    
+    Args:
+        transcript: The transcribed text to summarize
+        topic: Optional topic/context
+        language: Language code for output
+        custom_language: Custom language name if language is "other"
+    
+    Returns:
+        Tuple of (system_message, user_prompt) for structured output
+    """
+    language_name = get_language_name(language, custom_language)
+    
+    system_message = _STRUCTURED_SYS_MSG_BY_LANG.get(language_name)
+    if system_message is None:
+        system_message = _structured_system_message(language_name)
+    
+    topic_context = f"\nMEETING TOPIC: {topic}\n" if topic else ""
+    
+    user_prompt = STRUCTURED_USER_TEMPLATE % {
+        'topic_context': topic_context,
+        'transcript': transcript
+    }
+    
+    return system_message, user_prompt
+
+
+class PromptBuilder:
+    """
+    Legacy wrapper around the module-level prompt functions.
+    
+    Prompt building keeps no state, so new code should call
+    build_summary_prompt() and build_structured_summary_prompt() directly.
+    The class is kept so existing imports and instances keep working.
+    """
+    
+    _get_language_name = staticmethod(get_language_name)
+    build_summary_prompt = staticmethod(build_summary_prompt)
+    build_structured_summary_prompt = staticmethod(build_structured_summary_prompt)
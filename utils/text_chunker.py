@@ -2,9 +2,12 @@
 Text Chunker Module
 Handles intelligent splitting of long transcripts into manageable chunks.
 """
-from typing import List
+from typing import List, Tuple
 from config import MAX_CHARS_PER_CHUNK, CHUNK_OVERLAP
 
+# Sentence endings in order of preference when choosing a break point
+SENTENCE_ENDINGS = ('. ', '! ', '? ', '.\n', '!\n', '?\n')
+
 
 class TextChunker:
     """Utility for splitting long text into chunks while preserving context."""
@@ -37,12 +40,29 @@ class TextChunker:
         Returns:
             List of text chunks
         """
-        if len(text) <= self.max_chars:
-            return [text]
+        return [text[start:end] for start, end in self.chunk_text_spans(text)]
+    
+    def chunk_text_spans(self, text: str) -> List[Tuple[int, int]]:
+        """
+        Split text into chunks, returning index ranges instead of substrings.
         
-        chunks = []
-        current_pos = 0
+        Uses the same break rules as chunk_text(); text[start:end] for each
+        span is exactly the corresponding chunk. Callers that process chunks
+        one at a time can slice each chunk only when it is needed instead of
+        holding copies of all of them at once.
+        
+        Args:
+            text: The text to chunk
+            
+        Returns:
+            List of (start, end) half-open index ranges into text
+        """
         text_length = len(text)
+        if text_length <= self.max_chars:
+            return [(0, text_length)]
+        
+        spans = []
+        current_pos = 0
         
         while current_pos < text_length:
             # Calculate end position for this chunk
@@ -51,43 +71,49 @@ class TextChunker:
             # If this is not the last chunk, try to find a good break point
             if end_pos < text_length:
                 # Try to find sentence boundary (., !, ?)
-                chunk_text = text[current_pos:end_pos]
+                # Searches run on text with bounds, so the candidate chunk is
+                # never copied out just to look for a break point
                 
                 # Look for sentence endings in the last 20% of chunk
-                search_start = int(len(chunk_text) * 0.8)
-                sentence_endings = ['. ', '! ', '? ', '.\n', '!\n', '?\n']
+                search_start = current_pos + int((end_pos - current_pos) * 0.8)
                 
                 best_break = -1
-                for ending in sentence_endings:
+                for ending in SENTENCE_ENDINGS:
                     # Search backwards from end of chunk
-                    pos = chunk_text.rfind(ending, search_start)
+                    pos = text.rfind(ending, search_start, end_pos)
                     if pos != -1:
                         best_break = pos + len(ending)
                         break
                 
                 # If no sentence boundary found, try paragraph boundary
                 if best_break == -1:
-                    para_break = chunk_text.rfind('\n\n', search_start)
+                    para_break = text.rfind('\n\n', search_start, end_pos)
                     if para_break != -1:
                         best_break = para_break + 2
                 
                 # If still no good break, try word boundary (space)
                 if best_break == -1:
-                    word_break = chunk_text.rfind(' ', search_start)
+                    word_break = text.rfind(' ', search_start, end_pos)
                     if word_break != -1:
                         best_break = word_break + 1
                 
                 # Use best break if found, otherwise use max_chars
                 if best_break != -1:
-                    end_pos = current_pos + best_break
+                    end_pos = best_break
                 else:
                     # Force break at max_chars if no good break point
                     end_pos = current_pos + self.max_chars
             
-            # Extract chunk
-            chunk = text[current_pos:end_pos].strip()
-            if chunk:
-                chunks.append(chunk)
+            # Record the chunk with surrounding whitespace trimmed (the span
+            # equivalent of text[current_pos:end_pos].strip())
+            start = current_pos
+            end = end_pos
+            while start < end and text[start].isspace():
+                start += 1
+            while end > start and text[end - 1].isspace():
+                end -= 1
+            if start < end:
+                spans.append((start, end))
             
             # Move to next chunk with overlap
             if end_pos >= text_length:
@@ -96,17 +122,5 @@ class TextChunker:
             # Start next chunk with overlap
             current_pos = max(current_pos + 1, end_pos - self.overlap)
         
-        return chunks
-    
-    def estimate_token_count(self, text: str) -> int:
-        """
-        Estimate token count (rough approximation: 1 token ≈ 4 characters).
-        
-        Args:
-            text: Text to estimate
-            
-        Returns:
-            Estimated token count
-        """
-        return len(text) // 4
+        return spans
 
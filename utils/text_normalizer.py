@@ -4,12 +4,71 @@ Normalizes transcription text to fix capitalization and formatting issues.
 Applies to all languages, not just Vietnamese.
 Intelligently preserves proper nouns, acronyms, and technical terms.
 """
+import functools
 import re
 import logging
+from typing import Tuple
 
 logger = logging.getLogger(__name__)
 
 
+class _NonWordTable(dict):
+    """
+    str.translate table that deletes non-word characters (everything regex
+    \\w does not match). Entries are filled in lazily per code point.
+    """
+    
+    def __missing__(self, codepoint: int):
+        char = chr(codepoint)
+        value = codepoint if (char.isalnum() or char == '_') else None
+        self[codepoint] = value
+        return value
+
+
+_NON_WORD_TABLE = _NonWordTable()
+
+# A word made of a single run of word characters with optional leading and
+# trailing punctuation (groups: before, word, after)
+_CAPS_WORD_RE = re.compile(r'^([^\w]*)(\w+)([^\w]*)$')
+
+# Punctuation directly followed by a letter (a space is inserted between)
+_MISSING_SPACE_AFTER_PUNCT_RE = re.compile(r'([.,!?;:])([A-Za-zÀ-ỹ])')
+
+
+def _strip_non_word(word: str) -> str:
+    """
+    Remove non-word characters from a word (same as re.sub(r'[^\w]', '', word)).
+    
+    Args:
+        word: Word to clean
+        
+    Returns:
+        Word with only letters, digits and underscores
+    """
+    if word.isalnum():
+        return word
+    return word.translate(_NON_WORD_TABLE)
+
+
+def _edge_punctuation(word: str) -> Tuple[str, str]:
+    """
+    Get the leading and trailing runs of non-word characters of a word.
+    
+    Args:
+        word: Word containing at least one word character
+        
+    Returns:
+        Tuple of (punct_before, punct_after)
+    """
+    start = 0
+    end = len(word)
+    while start < end and _NON_WORD_TABLE[ord(word[start])] is None:
+        start += 1
+    while end > start and _NON_WORD_TABLE[ord(word[end - 1])] is None:
+        end -= 1
+    return word[:start], word[end:]
+
+
 class TextNormalizer:
     """
     Normalizes transcription text to improve quality.
@@ -26,11 +85,26 @@ class TextNormalizer:
     - Brand names
     """
     
+    # Fixed attribute set: no per-instance __dict__, and the attributes read
+    # on every word (common_acronyms, ...) are plain slot lookups
+    __slots__ = (
+        'common_acronyms',
+        'proper_noun_indicators',
+        '_proper_noun_combined',
+        '_normalize_cached',
+    )
+    
+    # Number of recent normalize() results kept per instance, so retries and
+    # re-summaries of the same transcript skip the work
+    CACHE_SIZE = 32
+    
     def __init__(self):
         """Initialize TextNormalizer."""
         # Common acronyms that should stay all caps
-        # These are technical terms, abbreviations that are always uppercase
-        self.common_acronyms = {
+        # These are technical terms, abbreviations that are always uppercase.
+        # Kept as a frozenset since it is only read on the hot path;
+        # add_acronym(s) replace it with an extended copy
+        self.common_acronyms = frozenset({
             'API', 'URL', 'HTTP', 'HTTPS', 'HTML', 'CSS', 'JS', 'JSON', 'XML',
             'PDF', 'CSV', 'SQL', 'AWS', 'GCP', 'AI', 'ML', 'DL', 'NLP',
             'CPU', 'GPU', 'RAM', 'SSD', 'HDD', 'USB', 'WiFi', 'VPN',
@@ -40,7 +114,7 @@ class TextNormalizer:
             'iOS', 'Android', 'Windows', 'Linux', 'macOS',
             'NASA', 'FBI', 'CIA', 'UN', 'WHO', 'EU', 'UK', 'USA',
             'GDP', 'KPI', 'ROI', 'SLA', 'SLO', 'MTTR', 'MTBF'
-        }
+        })
         
         # Common proper nouns patterns (company suffixes, titles)
         self.proper_noun_indicators = [
@@ -49,8 +123,15 @@ class TextNormalizer:
             r'\b[A-Z][a-z]+\s+(Inc|Ltd|Corp|LLC|Co)\.',  # Company names
         ]
         
-        # Compile patterns for performance
-        self.proper_noun_patterns = [re.compile(pattern) for pattern in self.proper_noun_indicators]
+        # Compile the patterns into one alternation, so a context string is
+        # scanned once instead of once per pattern
+        self._proper_noun_combined = re.compile(
+            '|'.join(f'(?:{pattern})' for pattern in self.proper_noun_indicators)
+        )
+        
+        # normalize() is a pure function of (text, language) for a given
+        # acronym list; the cache is cleared whenever acronyms are added
+        self._normalize_cached = functools.lru_cache(maxsize=self.CACHE_SIZE)(self._normalize_text)
         
     def _is_likely_proper_noun(self, word: str, context: str = '') -> bool:
         """
@@ -63,7 +144,11 @@ class TextNormalizer:
         Returns:
             True if word should be preserved as-is
         """
-        word_clean = re.sub(r'[^\w]', '', word).upper()
+        # An all-caps alphabetic word has nothing to strip or case-fold
+        if word.isalpha() and word.isupper():
+            word_clean = word
+        else:
+            word_clean = _strip_non_word(word).upper()
         
         # Check if it's a known acronym
         if word_clean in self.common_acronyms:
@@ -74,10 +159,8 @@ class TextNormalizer:
             return True
         
         # Check context for proper noun indicators
-        if context:
-            for pattern in self.proper_noun_patterns:
-                if pattern.search(context):
-                    return True
+        if context and self._proper_noun_combined.search(context):
+            return True
         
         # Words that start with capital and have mixed case are likely proper nouns
         # (already correctly formatted)
@@ -96,27 +179,47 @@ class TextNormalizer:
         Returns:
             True if likely an error (should be normalized)
         """
-        word_clean = re.sub(r'[^\w]', '', word)
+        word_clean = _strip_non_word(word)
         
-        # Very short words (1-2 chars) - likely not errors
-        if len(word_clean) <= 2:
+        # Only long all-caps words (>5 chars) are likely to be errors.
+        # Short ones (1-4 chars) might be acronyms or are too short to tell
+        if len(word_clean) <= 5 or not (word_clean.isupper() and word_clean.isalpha()):
             return False
         
-        # Known acronyms - not errors
-        if word_clean.upper() in self.common_acronyms:
-            return False
-        
-        # Long all-caps words (>5 chars) are more likely to be errors
-        # Short ones (3-4 chars) might be acronyms
-        if len(word_clean) > 5 and word_clean.isupper() and word_clean.isalpha():
-            return True
-        
-        # Words that are all caps and longer than 3 chars might be errors
-        # But we'll be conservative and only fix very long ones
-        if len(word_clean) > 6 and word_clean.isupper() and word_clean.isalpha():
-            return True
+        # Known acronyms - not errors (word_clean is already uppercase)
+        return word_clean not in self.common_acronyms
+    
+    def _capitalize_sentence_start(self, word: str) -> Tuple[str, bool]:
+        """
+        Capitalize the first letter of a sentence-starting word if needed.
         
-        return False
+        Args:
+            word: Word at the start of a sentence
+            
+        Returns:
+            Tuple of (word, still_pending) where still_pending is True if the
+            word has no letter and the next word starts the sentence instead
+        """
+        for first_letter_idx, first_char in enumerate(word):
+            if first_char.isalpha():
+                break
+        else:
+            return word, True
+        
+        first_word = word[first_letter_idx:]
+        first_word_clean = _strip_non_word(first_word)
+        
+        # Check if it's all lowercase or all uppercase (likely needs fixing)
+        # Only capitalize if it's not already a proper noun or acronym
+        if (first_word_clean.islower() or (
+            first_word_clean.isupper() and 
+            len(first_word_clean) > 3 and
+            first_word_clean.upper() not in self.common_acronyms
+        )) and not self._is_likely_proper_noun(first_word):
+            # Capitalize first letter, preserve rest
+            word = word[:first_letter_idx] + first_char.upper() + word[first_letter_idx + 1:]
+        
+        return word, False
         
     def normalize(self, text: str, language: str = None) -> str:
         """
@@ -132,111 +235,68 @@ class TextNormalizer:
         if not text or not text.strip():
             return text
         
-        # Step 1: Normalize whitespace
-        text = ' '.join(text.split())
+        return self._normalize_cached(text, language)
+    
+    def _normalize_text(self, text: str, language: str = None) -> str:
+        """
+        Normalize non-empty transcription text (uncached).
         
-        # Step 2: Fix all caps words (common transcription error)
-        # But preserve proper nouns, acronyms, and technical terms
+        Args:
+            text: Raw transcription text
+            language: Language code (optional, for language-specific rules)
+            
+        Returns:
+            Normalized text
+        """
+        # Single pass over the words: each word is case-fixed, capitalized if
+        # it starts a sentence and emitted with punctuation spacing applied,
+        # instead of rebuilding the whole string once per step
         words = text.split()
-        normalized_words = []
+        last_index = len(words) - 1
+        parts = []
+        at_sentence_start = True
+        
+        is_transcription_error = self._is_likely_transcription_error
+        is_proper_noun = self._is_likely_proper_noun
         
         for i, word in enumerate(words):
-            # Get context (previous and next words)
-            prev_word = words[i-1] if i > 0 else ''
-            next_word = words[i+1] if i < len(words) - 1 else ''
-            context = f"{prev_word} {word} {next_word}"
+            # Fix all caps words (common transcription error)
+            # But preserve proper nouns, acronyms, and technical terms.
+            # Only words that look like errors can change, so the cheap error
+            # test runs first and the context-based proper noun check (and
+            # the context string itself) is only needed for those few words
+            if is_transcription_error(word):
+                prev_word = words[i-1] if i > 0 else ''
+                next_word = words[i+1] if i < last_index else ''
+                context = f"{prev_word} {word} {next_word}"
+                
+                if not is_proper_noun(word, context):
+                    # It's likely a transcription error, convert to proper case
+                    # Preserve punctuation
+                    word_clean = _strip_non_word(word)
+                    punct_before, punct_after = _edge_punctuation(word)
+                    word = punct_before + word_clean.capitalize() + punct_after
             
-            # Remove punctuation temporarily to check
-            word_clean = re.sub(r'[^\w]', '', word)
+            # Fix sentence capitalization: the first word with a letter after
+            # a sentence ending (., !, ? followed by a space) starts a sentence
+            if at_sentence_start:
+                word, at_sentence_start = self._capitalize_sentence_start(word)
+            if i < last_index and word[-1] in '.!?':
+                at_sentence_start = True
             
-            # Check if it's likely a proper noun or acronym (preserve it)
-            if self._is_likely_proper_noun(word, context):
-                # Keep as-is (it's a proper noun or acronym)
-                normalized_words.append(word)
-            elif self._is_likely_transcription_error(word):
-                # It's likely a transcription error, convert to proper case
-                # Preserve punctuation
-                punct_before = re.match(r'^[^\w]*', word).group()
-                punct_after = re.search(r'[^\w]*$', word).group()
-                word_clean_normalized = word_clean.capitalize()
-                normalized_word = punct_before + word_clean_normalized + punct_after
-                normalized_words.append(normalized_word)
+            # Remove space before punctuation
+            if parts and word[0] in '.,!?;:':
+                parts.append(word)
+            elif parts:
+                parts.append(' ')
+                parts.append(word)
             else:
-                # Keep as-is (already correct or ambiguous)
-                normalized_words.append(word)
-        
-        text = ' '.join(normalized_words)
-        
-        # Step 3: Fix sentence capitalization
-        # Split by sentence endings
-        sentences = re.split(r'([.!?]\s+)', text)
-        processed_sentences = []
-        
-        for i, sentence in enumerate(sentences):
-            if sentence.strip() and not re.match(r'^[.!?]\s+$', sentence):
-                # Check if this is the start of a sentence
-                is_sentence_start = (
-                    i == 0 or 
-                    (i > 0 and re.match(r'^[.!?]\s+$', sentences[i-1]))
-                )
-                
-                if is_sentence_start:
-                    # Capitalize first letter of sentence
-                    sentence = sentence.strip()
-                    if len(sentence) > 0:
-                        # Find first letter (skip leading punctuation)
-                        first_letter_idx = 0
-                        for idx, char in enumerate(sentence):
-                            if char.isalpha():
-                                first_letter_idx = idx
-                                break
-                        
-                        if first_letter_idx < len(sentence):
-                            # Get first word
-                            first_word_end = sentence.find(' ', first_letter_idx)
-                            if first_word_end == -1:
-                                first_word_end = len(sentence)
-                            
-                            first_word = sentence[first_letter_idx:first_word_end]
-                            first_word_clean = re.sub(r'[^\w]', '', first_word)
-                            
-                            # Only capitalize if it's not already a proper noun or acronym
-                            if not self._is_likely_proper_noun(first_word):
-                                # Check if it's all lowercase or all uppercase (likely needs fixing)
-                                if first_word_clean.islower() or (
-                                    first_word_clean.isupper() and 
-                                    len(first_word_clean) > 3 and
-                                    first_word_clean.upper() not in self.common_acronyms
-                                ):
-                                    # Capitalize first letter, preserve rest
-                                    if len(first_word) > 0:
-                                        first_char = first_word[0]
-                                        if first_char.isalpha():
-                                            first_word = first_char.upper() + first_word[1:]
-                            
-                            sentence = (
-                                sentence[:first_letter_idx] + 
-                                first_word + 
-                                sentence[first_word_end:]
-                            )
-                
-                processed_sentences.append(sentence)
-            else:
-                processed_sentences.append(sentence)
+                parts.append(word)
         
-        text = ''.join(processed_sentences)
+        text = ''.join(parts)
         
-        # Step 4: Fix common formatting issues
-        # Remove space before punctuation
-        text = re.sub(r'\s+([.,!?;:])', r'\1', text)
         # Add space after punctuation if missing
-        text = re.sub(r'([.,!?;:])([A-Za-zÀ-ỹ])', r'\1 \2', text)
-        
-        # Step 5: Normalize multiple spaces
-        text = re.sub(r'\s+', ' ', text)
-        
-        # Step 6: Final trim
-        text = text.strip()
+        text = _MISSING_SPACE_AFTER_PUNCT_RE.sub(r'\1 \2', text)
         
         return text
     
@@ -255,32 +315,31 @@ class TextNormalizer:
             return text
         
         words = text.split()
+        last_index = len(words) - 1
         fixed_words = []
         
         for i, word in enumerate(words):
+            # Only words made of a single run of word characters (with
+            # optional surrounding punctuation) are candidates
+            word_match = _CAPS_WORD_RE.match(word)
+            if word_match is None or not self._is_likely_transcription_error(word):
+                # Keep as-is
+                fixed_words.append(word)
+                continue
+            
             # Get context
             prev_word = words[i-1] if i > 0 else ''
-            next_word = words[i+1] if i < len(words) - 1 else ''
+            next_word = words[i+1] if i < last_index else ''
             context = f"{prev_word} {word} {next_word}"
             
-            # Extract word without punctuation
-            word_match = re.match(r'^([^\w]*)(\w+)([^\w]*)$', word)
-            if word_match:
-                punct_before, word_clean, punct_after = word_match.groups()
-                
-                # Check if it's a proper noun or acronym (preserve it)
-                if self._is_likely_proper_noun(word, context):
-                    # Keep as-is
-                    fixed_words.append(word)
-                elif self._is_likely_transcription_error(word):
-                    # Convert to proper case
-                    word_clean = word_clean.capitalize()
-                    fixed_words.append(punct_before + word_clean + punct_after)
-                else:
-                    # Keep as-is
-                    fixed_words.append(word)
-            else:
+            # Check if it's a proper noun or acronym (preserve it)
+            if self._is_likely_proper_noun(word, context):
+                # Keep as-is
                 fixed_words.append(word)
+            else:
+                # Convert to proper case
+                punct_before, word_clean, punct_after = word_match.groups()
+                fixed_words.append(punct_before + word_clean.capitalize() + punct_after)
         
         return ' '.join(fixed_words)
     
@@ -291,7 +350,8 @@ class TextNormalizer:
         Args:
             acronym: Acronym to preserve (will be converted to uppercase)
         """
-        self.common_acronyms.add(acronym.upper())
+        self.common_acronyms = self.common_acronyms | {acronym.upper()}
+        self._normalize_cached.cache_clear()
         logger.debug(f"Added acronym to preserve list: {acronym.upper()}")
     
     def add_acronyms(self, acronyms: list):
@@ -301,7 +361,15 @@ class TextNormalizer:
         Args:
             acronyms: List of acronyms to preserve
         """
-        for acronym in acronyms:
-            self.common_acronyms.add(acronym.upper())
+        self.common_acronyms = self.common_acronyms | {acronym.upper() for acronym in acronyms}
+        self._normalize_cached.cache_clear()
         logger.debug(f"Added {len(acronyms)} acronyms to preserve list")
 
+
+# Global shared instance, so the result cache is reused across requests
+_text_normalizer = TextNormalizer()
+
+def get_text_normalizer() -> TextNormalizer:
+    """Get the global TextNormalizer instance."""
+    return _text_normalizer
+
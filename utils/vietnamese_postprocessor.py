@@ -3,9 +3,13 @@ Vietnamese Post-Processing Module
 Handles post-processing of Vietnamese transcriptions to improve accuracy.
 Fixes common transcription errors and improves text quality.
 """
+import functools
 import re
 from typing import List, Tuple
 
+# Sentence delimiter (kept in the split result by the capturing group)
+_SENTENCE_SPLIT_RE = re.compile(r'([.!?]\s+)')
+
 
 class VietnamesePostProcessor:
     """
@@ -13,6 +17,14 @@ class VietnamesePostProcessor:
     Fixes common errors and improves text quality.
     """
     
+    # Fixed attribute set: no per-instance __dict__, and the attributes read
+    # on every call are plain slot lookups
+    __slots__ = (
+        'compiled_patterns',
+        '_correction_map',
+        '_post_process_cached',
+    )
+    
     # Common Vietnamese word corrections (transcription errors -> correct form)
     # These are common mistakes made by Whisper when transcribing Vietnamese
     COMMON_CORRECTIONS = {
@@ -51,6 +63,17 @@ class VietnamesePostProcessor:
         'mười': ['mười', 'muoi', 'muoi'],
     }
     
+    # Misspelled forms from COMMON_CORRECTIONS that are also correctly
+    # spelled words, or common stand-ins for other words ("nay" as in
+    # "hôm nay", "cua" for "crab", "muoi" for muối/muỗi, "chin" in English,
+    # ...). Rewriting these would corrupt valid text, so
+    # fix_common_errors() leaves them alone
+    AMBIGUOUS_FORMS = frozenset({
+        'voi', 'vơi', 'nay', 'do', 'cua', 'nhung', 'neu', 'thi', 'va', 'de',
+        'ma', 'nen', 'vi', 'da', 'se', 'dang', 'co', 'la', 'mot', 'bon',
+        'nam', 'sau', 'bay', 'tam', 'chin', 'muoi',
+    })
+    
     # Common phrase patterns to fix
     PHRASE_PATTERNS = [
         # Fix spacing issues
@@ -65,6 +88,9 @@ class VietnamesePostProcessor:
         (r'\btạm\s+biệt\b', 'tạm biệt'),
     ]
     
+    # Number of recent post_process() results kept per instance
+    CACHE_SIZE = 32
+    
     def __init__(self):
         """Initialize VietnamesePostProcessor."""
         # Compile regex patterns for better performance
@@ -72,6 +98,19 @@ class VietnamesePostProcessor:
             (re.compile(pattern), replacement)
             for pattern, replacement in self.PHRASE_PATTERNS
         ]
+        # Flat lookup from every known form (misspelled or correct, lowercase)
+        # to the correct form; COMMON_CORRECTIONS itself is keyed by the
+        # correct form, so misspellings can't be looked up in it directly.
+        # Ambiguous forms are left out (see AMBIGUOUS_FORMS)
+        self._correction_map = {
+            form: correct
+            for correct, forms in self.COMMON_CORRECTIONS.items()
+            for form in (correct, *forms)
+            if form == correct or form not in self.AMBIGUOUS_FORMS
+        }
+        # post_process() is a pure function of the text, so repeated runs on
+        # the same transcript (retries, re-summaries) are served from cache
+        self._post_process_cached = functools.lru_cache(maxsize=self.CACHE_SIZE)(self._post_process_text)
     
     def post_process(self, text: str) -> str:
         """
@@ -86,6 +125,18 @@ class VietnamesePostProcessor:
         if not text or not text.strip():
             return text
         
+        return self._post_process_cached(text)
+    
+    def _post_process_text(self, text: str) -> str:
+        """
+        Post-process non-empty Vietnamese transcription text (uncached).
+        
+        Args:
+            text: Raw transcription text from Whisper
+            
+        Returns:
+            Post-processed text with improved accuracy
+        """
         # Step 1: Normalize whitespace
         text = ' '.join(text.split())
         
@@ -94,15 +145,11 @@ class VietnamesePostProcessor:
             text = pattern.sub(replacement, text)
         
         # Step 3: Capitalize first letter of sentences
-        sentences = re.split(r'([.!?]\s+)', text)
-        processed_sentences = []
-        for i, sentence in enumerate(sentences):
-            if sentence.strip() and not re.match(r'^[.!?]\s+$', sentence):
-                # Capitalize first letter if it's the start or after punctuation
-                if i == 0 or (i > 0 and re.match(r'^[.!?]\s+$', sentences[i-1])):
-                    sentence = sentence[0].upper() + sentence[1:] if len(sentence) > 0 else sentence
-            processed_sentences.append(sentence)
-        text = ''.join(processed_sentences)
+        # The split alternates sentence, delimiter, sentence, ... so every
+        # even-indexed piece starts a sentence and no per-piece test is needed
+        pieces = _SENTENCE_SPLIT_RE.split(text)
+        pieces[::2] = [sentence[:1].upper() + sentence[1:] for sentence in pieces[::2]]
+        text = ''.join(pieces)
         
         # Step 4: Final cleanup
         text = text.strip()
@@ -124,18 +171,24 @@ class VietnamesePostProcessor:
         words = text.split()
         corrected_words = []
         
+        correction_map = self._correction_map
         for word in words:
             # Check if word needs correction
-            word_lower = word.lower()
-            if word_lower in self.COMMON_CORRECTIONS:
-                # Use the first (correct) form
-                corrected_word = self.COMMON_CORRECTIONS[word_lower][0]
-                # Preserve original capitalization
-                if word[0].isupper():
-                    corrected_word = corrected_word.capitalize()
-                corrected_words.append(corrected_word)
-            else:
+            corrected_word = correction_map.get(word.lower())
+            if corrected_word is None:
                 corrected_words.append(word)
+                continue
+            # Preserve original capitalization
+            if word[0].isupper():
+                corrected_word = corrected_word.capitalize()
+            corrected_words.append(corrected_word)
         
         return ' '.join(corrected_words)
 
+
+# Global shared instance, so the result cache is reused across requests
+_vietnamese_postprocessor = VietnamesePostProcessor()
+
+def get_vietnamese_postprocessor() -> VietnamesePostProcessor:
+    """Get the global VietnamesePostProcessor instance."""
+    return _vietnamese_postprocessor